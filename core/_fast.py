@@ -0,0 +1,90 @@
+"""
+Module: _fast.py
+Description: Small per-frame numeric kernels for the hand-tracking hot path,
+             JIT-compiled with Numba when it is installed and falling back
+             to equivalent NumPy code otherwise.
+Author: Pratham Chaturvedi
+
+core/_fast.py - Compiled Landmark Kernels
+
+Every kernel takes the (21, 3) float32 landmark array produced by
+HandTracker and works purely on numbers, so Numba can lower it to native
+code. Signatures are given up front so compilation happens at import time
+(and is cached on disk) instead of on the first camera frame.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Tip / lower-joint landmark pairs, thumb first (thumb uses its IP joint)
+_TIP_IDS = np.array([4, 8, 12, 16, 20], dtype=np.int32)
+_PIP_IDS = np.array([3, 6, 10, 14, 18], dtype=np.int32)
+
+
+_BIT_WEIGHTS = np.array([1, 2, 4, 8, 16], dtype=np.int32)
+
+
+def _finger_mask_py(lm: np.ndarray) -> int:
+    """
+    Return the 5-bit finger mask (bit 0 = thumb … bit 4 = pinky), 1 = extended.
+
+    Thumb  : extended when x-distance tip→wrist > ip→wrist
+    Others : extended when tip.y < pip.y (tip is higher on screen)
+    """
+    up = lm[_TIP_IDS, 1] < lm[_PIP_IDS, 1]
+    wrist_x = lm[0, 0]
+    up[0] = abs(lm[4, 0] - wrist_x) > abs(lm[3, 0] - wrist_x)
+    return int(_BIT_WEIGHTS[up].sum())
+
+
+def _mask_and_gesture_py(lm: np.ndarray, table: np.ndarray) -> tuple[int, int]:
+    """Return (finger_mask, gesture_id) with gesture_id = table[finger_mask]."""
+    mask = _finger_mask_py(lm)
+    return mask, int(table[mask])
+
+
+def _project_landmarks_py(lm: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Map normalised landmarks to int32 (21, 2) pixel coordinates."""
+    return (lm[:, :2] * np.array([width, height], dtype=np.float32)).astype(np.int32)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit('uint8(float32[:, :])', cache=True, nogil=True)
+    def finger_mask(lm):
+        wrist_x = lm[0, 0]
+        mask = np.uint8(abs(lm[4, 0] - wrist_x) > abs(lm[3, 0] - wrist_x))
+        if lm[8, 1]  < lm[6, 1]:
+            mask |= 2
+        if lm[12, 1] < lm[10, 1]:
+            mask |= 4
+        if lm[16, 1] < lm[14, 1]:
+            mask |= 8
+        if lm[20, 1] < lm[18, 1]:
+            mask |= 16
+        return mask
+
+    @njit('UniTuple(uint8, 2)(float32[:, :], uint8[:])', cache=True, nogil=True)
+    def mask_and_gesture(lm, table):
+        mask = finger_mask(lm)
+        return mask, table[mask]
+
+    @njit('int32[:, :](float32[:, :], int32, int32)', cache=True, nogil=True)
+    def project_landmarks(lm, width, height):
+        n   = lm.shape[0]
+        out = np.empty((n, 2), dtype=np.int32)
+        for i in range(n):
+            out[i, 0] = np.int32(lm[i, 0] * np.float32(width))
+            out[i, 1] = np.int32(lm[i, 1] * np.float32(height))
+        return out
+
+else:
+    finger_mask       = _finger_mask_py
+    mask_and_gesture  = _mask_and_gesture_py
+    project_landmarks = _project_landmarks_py
@@ -8,8 +8,15 @@ core/camera.py - The Eyes
 
 Opens and manages the laptop webcam. Captures video frames continuously
 and provides them to the rest of the pipeline.
+
+Optional async capture (start_async) reads frames on a daemon thread into
+a single "latest frame" slot — stale frames are dropped, never queued.
 """
 
+import os
+import threading
+import time
+
 import cv2
 
 
@@ -24,22 +31,48 @@ class Camera:
         self._index = camera_index
         self._cap: cv2.VideoCapture | None = None
 
+        # Async capture state (see start_async)
+        self._reader: threading.Thread | None = None
+        self._reading   = False
+        self._lock      = threading.Lock()
+        self._new_frame = threading.Event()
+        self._latest: tuple[bool, object] = (False, None)
+        self._latest_time = 0.0
+        self._last_frame_time = 0.0   # time.monotonic() of the last frame returned
+        self._reader_exited = False   # set by the reader, under _lock, as it stops
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
     def open(self) -> bool:
         """Open the camera. Returns True on success, False otherwise."""
-        self._cap = cv2.VideoCapture(self._index)
+        # On Windows prefer DirectShow: unlike the default MSMF backend it
+        # honours CAP_PROP_BUFFERSIZE and opens without a multi-second stall.
+        self._cap = None
+        if os.name == 'nt':
+            self._cap = cv2.VideoCapture(self._index, cv2.CAP_DSHOW)
+        if self._cap is None or not self._cap.isOpened():
+            self._cap = cv2.VideoCapture(self._index)
         if not self._cap.isOpened():
             print(f'[Camera] Could not open camera index {self._index}')
             return False
 
+        # Request MJPEG first — cheaper to decode than YUY2 at 720p and
+        # drivers are more likely to honour the requested FPS with it.
+        # Order matters: FOURCC, then resolution, then FPS, then buffer size.
+        self._cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+
         # Request resolution and FPS
         self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, self._width)
         self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self._height)
         self._cap.set(cv2.CAP_PROP_FPS, self._fps)
 
+        # Keep a single frame in the driver queue so every read is fresh
+        if not self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            print('[Camera] Warning: backend ignored CAP_PROP_BUFFERSIZE=1 '
+                  '— latency will be higher')
+
         # Report actual values (hardware may clamp them)
         actual_w = int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         actual_h = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
@@ -47,8 +80,37 @@ class Camera:
         print(f'Camera initialized: {actual_w}x{actual_h} @ {actual_fps}fps')
         return True
 
+    def start_async(self) -> None:
+        """
+        Start reading frames on a background thread.
+
+        Afterwards read_frame() returns the most recent frame only; frames
+        the consumer was too slow to collect are overwritten, not buffered.
+        """
+        if self._reader is not None or not self.is_opened():
+            return
+        self._reading = True
+        self._reader_exited = False
+        self._reader  = threading.Thread(
+            target=self._read_loop, name='CameraReader', daemon=True,
+        )
+        self._reader.start()
+
     def release(self) -> None:
         """Release the camera resource."""
+        if self._reader is not None:
+            self._reading = False
+            self._reader.join(timeout=1.0)
+            with self._lock:
+                if self._reader.is_alive() and not self._reader_exited:
+                    # Still blocked in cap.read() (common with DirectShow):
+                    # releasing now would free the device under it, so the
+                    # reader closes the capture itself once read() returns
+                    print('[Camera] Reader still blocked in read(); '
+                          'it will release the camera when it returns')
+                    self._cap = None
+            self._reader = None
+            self._new_frame.set()   # wake any consumer still waiting
         if self._cap is not None:
             self._cap.release()
             self._cap = None
@@ -58,11 +120,51 @@ class Camera:
     # Frame capture
     # ------------------------------------------------------------------
 
-    def read_frame(self) -> tuple[bool, object]:
-        """Read one frame. Returns (success, frame)."""
+    def read_frame(self, skip: int = 0) -> tuple[bool, object]:
+        """
+        Read one frame. Returns (success, frame).
+
+        Args:
+            skip: Number of queued frames to discard first.  Skipped frames
+                  are only grabbed (no decode), so a slow consumer can catch
+                  up cheaply instead of processing stale frames.
+        """
         if self._cap is None or not self._cap.isOpened():
             return False, None
-        return self._cap.read()
+        if self._reader is not None:
+            # Async mode: hand over the single latest frame (skip is moot)
+            if not self._new_frame.wait(timeout=1.0):
+                return False, None
+            with self._lock:
+                latest = self._latest
+                self._last_frame_time = self._latest_time
+                self._new_frame.clear()
+            return latest
+        for _ in range(skip):
+            self._cap.grab()
+        if not self._cap.grab():
+            return False, None
+        self._last_frame_time = time.monotonic()
+        return self._cap.retrieve()
+
+    def _read_loop(self) -> None:
+        """Background reader: publish each frame into the 1-slot holder."""
+        cap = self._cap
+        while self._reading:
+            ok, frame = cap.read()
+            stamp = time.monotonic()
+            with self._lock:
+                self._latest = (ok, frame)
+                self._latest_time = stamp
+                self._new_frame.set()
+            if not ok:
+                time.sleep(0.01)   # device hiccup — don't spin
+        with self._lock:
+            self._reader_exited = True
+            orphaned = self._cap is not cap   # release() gave up waiting on us
+        if orphaned:
+            cap.release()
+            print('Camera released')
 
     # ------------------------------------------------------------------
     # Status
@@ -79,3 +181,12 @@ class Camera:
     @property
     def height(self) -> int:
         return self._height
+
+    @property
+    def fps(self) -> int:
+        return self._fps
+
+    @property
+    def last_frame_time(self) -> float:
+        """time.monotonic() at which the most recently returned frame was grabbed."""
+        return self._last_frame_time
@@ -23,7 +23,12 @@ Recognised gestures:
     Pinky         – only pinky up
 """
 
+import sys
+
 import cv2
+import numpy as np
+
+from utils.overlay import Sprite
 
 
 class GestureClassifier:
@@ -52,24 +57,51 @@ class GestureClassifier:
     # Gestures that require ALL five fingers to be checked
     _FULL_CHECK = {'Open Palm', 'Fist', 'Thumbs Up'}
 
+    # Finger order used for bit-packing: bit i is set when finger i is extended
+    _FINGERS = ('thumb', 'index', 'middle', 'ring', 'pinky')
+
+    def __init__(self) -> None:
+        # Pre-rendered gesture label pills, built on first use per label
+        self._sprites: dict[str, tuple[Sprite, int, int]] = {}
+
     # ------------------------------------------------------------------
     # Classification
     # ------------------------------------------------------------------
 
-    def classify(self, finger_states: dict) -> str:
+    def classify(self, finger_states) -> str:
         """
         Return the gesture name that best matches the given finger states.
         Falls back to 'Unknown' if no pattern matches.
 
         Args:
-            finger_states: dict with keys 'thumb','index','middle','ring','pinky'
-                           and bool values (True = extended).
+            finger_states: 5-bit finger mask (bit 0 = thumb … bit 4 = pinky),
+                           -OR- a dict with keys 'thumb','index','middle',
+                           'ring','pinky' and bool values (True = extended).
         """
+        if isinstance(finger_states, (int, np.integer)):
+            return _GESTURE_TABLE[finger_states & 0b11111]
         if not finger_states:
             return 'Unknown'
 
-        for gesture_name, pattern in self._PATTERNS:
-            if gesture_name in self._FULL_CHECK:
+        try:
+            mask = 0
+            for i, f in enumerate(self._FINGERS):
+                if finger_states[f]:
+                    mask |= 1 << i
+        except KeyError:
+            # Partial state dicts keep the original "don't care" semantics
+            return self._match(finger_states)
+        return _GESTURE_TABLE[mask]
+
+    def classify_mask(self, mask: int) -> str:
+        """Classify a 5-bit finger mask (bit 0 = thumb … bit 4 = pinky)."""
+        return _GESTURE_TABLE[mask & 0b11111]
+
+    @classmethod
+    def _match(cls, finger_states: dict) -> str:
+        """Scan _PATTERNS in priority order and return the first match."""
+        for gesture_name, pattern in cls._PATTERNS:
+            if gesture_name in cls._FULL_CHECK:
                 # Every finger must match exactly
                 if all(finger_states.get(f) == v for f, v in pattern.items()):
                     return gesture_name
@@ -102,20 +134,58 @@ class GestureClassifier:
 
         y = 68
 
-        # Background pill
-        text = f'Gesture: {gesture}'
-        (tw, th), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)
-        cv2.rectangle(frame, (x - 6, y - th - 6), (x + tw + 6, y + 6),
-                      (30, 30, 30), -1)
-        cv2.rectangle(frame, (x - 6, y - th - 6), (x + tw + 6, y + 6),
-                      (0, 200, 200), 1)
-
-        cv2.putText(
-            frame, text, (x, y),
-            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2, cv2.LINE_AA,
-        )
+        sprite, dx, dy = self._label_sprite(gesture)
+        sprite.blit(frame, x + dx, y + dy)
         return frame
 
+    def _label_sprite(self, gesture: str) -> tuple[Sprite, int, int]:
+        """
+        Return (sprite, dx, dy) for a gesture label, rendering it on first use.
+        dx/dy offset the sprite's top-left from the text baseline origin.
+        """
+        cached = self._sprites.get(gesture)
+        if cached is not None:
+            return cached
+
+        text = f'Gesture: {gesture}'
+        (tw, th), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)
+        pad    = 6
+        width  = tw + 2 * pad + 1
+        height = th + 2 * pad + 1 + max(baseline + 2 - pad, 0)   # room for descenders
+        ox, oy = pad, th + pad                                   # text origin in sprite
+
+        sprite = Sprite(width, height)
+        mask   = np.zeros((height, width), dtype=np.uint8)
+
+        # Background pill (opaque)
+        for canvas, fill, edge in ((sprite.image, (30, 30, 30), (0, 200, 200)),
+                                   (mask, 255, 255)):
+            cv2.rectangle(canvas, (0, 0), (tw + 2 * pad, th + 2 * pad), fill, -1)
+            cv2.rectangle(canvas, (0, 0), (tw + 2 * pad, th + 2 * pad), edge, 1)
+
+        # Text (anti-aliased coverage also feeds the alpha mask for descenders)
+        cv2.putText(sprite.image, text, (ox, oy),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2, cv2.LINE_AA)
+        cv2.putText(mask, text, (ox, oy),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, 255, 2, cv2.LINE_AA)
+        sprite.set_alpha_from_mask(mask)
+
+        cached = (sprite, -ox, -oy)
+        self._sprites[gesture] = cached
+        return cached
+
+
+# Only 32 finger combinations exist — resolve each one once at import so
+# classify() is a single tuple index, shared by every classifier instance.
+# Names are interned so downstream dict lookups / equality checks on the
+# returned label hit the identity fast path.
+_GESTURE_TABLE: tuple[str, ...] = tuple(
+    sys.intern(GestureClassifier._match(
+        {f: bool(mask >> i & 1) for i, f in enumerate(GestureClassifier._FINGERS)}
+    ))
+    for mask in range(32)
+)
+
 
 # ---------------------------------------------------------------------------
 # Module-level convenience wrapper (used by simple tests and external callers)
@@ -124,6 +194,15 @@ class GestureClassifier:
 _FINGER_KEYS = ('thumb', 'index', 'middle', 'ring', 'pinky')
 _clf = GestureClassifier()
 
+# Numeric gesture ids for the compiled hot path (core/_fast.mask_and_gesture):
+# GESTURE_NAMES[id] is the label, GESTURE_ID_BY_MASK[mask] the id per 5-bit mask.
+GESTURE_NAMES: tuple[str, ...] = tuple(
+    sys.intern(name) for name in ('Unknown', *(n for n, _ in GestureClassifier._PATTERNS))
+)
+GESTURE_ID_BY_MASK = np.array(
+    [GESTURE_NAMES.index(name) for name in _GESTURE_TABLE], dtype=np.uint8,
+)
+
 
 def classify_gesture(fingers) -> str:
     """
@@ -139,5 +218,11 @@ def classify_gesture(fingers) -> str:
     """
     if isinstance(fingers, dict):
         return _clf.classify(fingers)
-    states = {key: bool(val) for key, val in zip(_FINGER_KEYS, fingers)}
-    return _clf.classify(states)
+    if len(fingers) != len(_FINGER_KEYS):
+        states = {key: bool(val) for key, val in zip(_FINGER_KEYS, fingers)}
+        return _clf.classify(states)
+    mask = 0
+    for i, val in enumerate(fingers):
+        if val:
+            mask |= 1 << i
+    return _clf.classify_mask(mask)
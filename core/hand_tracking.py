@@ -14,12 +14,25 @@ Uses MediaPipe AI technology (Tasks API, mediapipe >= 0.10.0) to:
 - Determine which fingers are up or down
 - Distinguish between left and right hands
 - Support up to 2 hands simultaneously
+- Optionally run inference asynchronously (LIVE_STREAM mode) so the
+  capture / render loop never blocks on MediaPipe
 
 Requires: hand_landmarker.task model file in the project root.
 Download: https://storage.googleapis.com/mediapipe-models/hand_landmarker/
           hand_landmarker/float16/1/hand_landmarker.task
+If the file is missing it is fetched on a background thread as soon as this
+module is imported, so the download overlaps the rest of startup.
 """
 
+import math
+import os
+import threading
+import time
+import urllib.request
+from http.client import HTTPException
+from itertools import chain
+from types import MappingProxyType
+
 import cv2
 import numpy as np
 import mediapipe as mp
@@ -27,6 +40,10 @@ from mediapipe.tasks import python as mp_python
 from mediapipe.tasks.python import vision as mp_vision
 from pathlib import Path
 
+from core import _fast
+from core.gesture_classifier import GESTURE_ID_BY_MASK, GESTURE_NAMES
+from utils.overlay import Sprite, text_sprite
+
 
 # Hand skeleton connection pairs (MediaPipe landmark index pairs)
 _HAND_CONNECTIONS = [
@@ -57,51 +74,332 @@ _TIP_GROUPS = {
     'wrist':  [0],
 }
 
+_FINGER_NAMES = ('thumb', 'index', 'middle', 'ring', 'pinky')
+
+# Read-only finger-state dict for each 5-bit mask (bit i = _FINGER_NAMES[i])
+_STATES_BY_MASK = tuple(
+    MappingProxyType({name: bool(mask >> i & 1) for i, name in enumerate(_FINGER_NAMES)})
+    for mask in range(32)
+)
+
+
+# ---------------------------------------------------------------------------
+# Model file prefetch
+# ---------------------------------------------------------------------------
+
+_MODEL_PATH = Path(__file__).parent.parent / 'hand_landmarker.task'
+_MODEL_URL  = ('https://storage.googleapis.com/mediapipe-models/hand_landmarker/'
+               'hand_landmarker/float16/1/hand_landmarker.task')
+_MODEL_MIN_BYTES = 1_000_000     # anything smaller is a truncated download
+_CHUNK_BYTES     = 256 * 1024
+_DOWNLOAD_ATTEMPTS = 3
+
+
+def _model_ready() -> bool:
+    return _MODEL_PATH.is_file() and _MODEL_PATH.stat().st_size > _MODEL_MIN_BYTES
+
+
+def _prefetch_model() -> None:
+    """
+    Stream the model to <name>.part in 256 KB chunks, then move it into place.
+
+    The rename only happens once the byte count matches Content-Length (and
+    clears _MODEL_MIN_BYTES); failed or truncated attempts are retried with
+    a short backoff and never leave a .part file behind.
+    """
+    part = _MODEL_PATH.with_suffix('.task.part')
+    for attempt in range(1, _DOWNLOAD_ATTEMPTS + 1):
+        try:
+            with urllib.request.urlopen(_MODEL_URL, timeout=30) as resp, open(part, 'wb') as out:
+                expected = int(resp.headers.get('Content-Length') or 0)
+                done = 0
+                while chunk := resp.read(_CHUNK_BYTES):
+                    out.write(chunk)
+                    done += len(chunk)
+            if done < _MODEL_MIN_BYTES or (expected and done != expected):
+                raise OSError(f'truncated download ({done} of {expected or "?"} bytes)')
+            os.replace(part, _MODEL_PATH)
+            print(f'[HandTracker] Downloaded model ({done} bytes)')
+            return
+        except (OSError, HTTPException, ValueError) as exc:
+            part.unlink(missing_ok=True)
+            print(f'[HandTracker] Model download failed '
+                  f'(attempt {attempt}/{_DOWNLOAD_ATTEMPTS}): {exc}')
+            if attempt < _DOWNLOAD_ATTEMPTS:
+                time.sleep(2 ** attempt)
+
+
+_prefetch_thread: threading.Thread | None = None
+if not _model_ready():
+    _prefetch_thread = threading.Thread(
+        target=_prefetch_model, name='ModelPrefetch', daemon=True,
+    )
+    _prefetch_thread.start()
+
+
+def _landmarks_to_array(lm_list) -> np.ndarray:
+    """Materialise 21 MediaPipe landmarks as a (21, 3) float32 array."""
+    return np.fromiter(
+        chain.from_iterable((lm.x, lm.y, lm.z) for lm in lm_list),
+        dtype=np.float32, count=63,
+    ).reshape(21, 3)
+
+
+def configure_opencv(threads: int | None = None) -> None:
+    """
+    Apply process-wide OpenCV settings for the tracking pipeline.
+
+    Call once at application startup, before building a HandTracker.
+    threads sizes OpenCV's worker pool; None = half the logical CPUs,
+    leaving the rest to MediaPipe's own inference threads.
+    """
+    if threads is None:
+        threads = max(1, (os.cpu_count() or 2) // 2)
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(threads)
+    print(f'[HandTracker] OpenCV threads: {threads}')
+
 
 class HandTracker:
     """
     Wraps the MediaPipe Tasks HandLandmarker to provide hand detection,
     landmark extraction, finger-state analysis, and on-screen drawing.
+
+    Threading: the resize / colour conversion for a frame runs outside
+    _detector_lock, which guards only the MediaPipe detector itself, so a
+    capture thread can keep running while a frame is being prepared.  VIDEO
+    mode still blocks the caller for the whole inference; LIVE_STREAM mode
+    (live_stream=True) hands inference to MediaPipe's own worker thread and
+    is the preferred setup when Camera.start_async() is used.
     """
 
+    # Per-frame drawing constants, built once at import
+    _CONN = np.array(_HAND_CONNECTIONS, dtype=np.int32)          # (21, 2) bone pairs
+    _DOTS: tuple[tuple[int, tuple], ...] = tuple(                 # (landmark, colour)
+        (idx, _LANDMARK_COLOURS[group])
+        for group, ids in _TIP_GROUPS.items() for idx in ids
+    )
+
+    # Wrist badge per hand side: (hands_info key, label, colour)
+    _SIDE_BADGES = (('right', 'RIGHT', (0, 255, 100)), ('left', 'LEFT', (100, 200, 255)))
+
+    # Finger-state panel layout
+    _STATE_ROW_STEP = 26
+    _STATE_TOP      = 14    # strip pixels above the text baseline
+
     def __init__(
         self,
         max_num_hands: int = 2,
         min_detection_confidence: float = 0.7,
         min_tracking_confidence: float = 0.5,
         model_path: str | None = None,
+        live_stream: bool = False,
+        detect_size: int = 256,
+        use_opencl: bool = False,
+        use_gpu: bool = True,
+        detect_every: int = 1,
+        frame_budget: float | None = None,
     ):
-        # Resolve model file
+        """
+        Args:
+            live_stream: Use MediaPipe LIVE_STREAM mode.  Frames are submitted
+                         with detect_async() and results arrive on a MediaPipe
+                         thread; detect_hands() then returns immediately with
+                         the most recent finished result instead of blocking.
+            detect_size: Frames whose shorter side exceeds this are
+                         downscaled (keeping aspect ratio) before inference;
+                         the models run at 192–256 px anyway.  Landmarks come
+                         back normalised, so drawing on the full-res frame is
+                         unaffected.  0 disables downscaling.
+            use_opencl: Run the resize / colour conversion through cv2.UMat
+                         (OpenCL, e.g. on an integrated GPU) and download only
+                         the small RGB result for MediaPipe.  Ignored when
+                         OpenCV has no usable OpenCL device.
+            use_gpu:     Run the palm / landmark models on MediaPipe's GPU
+                         delegate.  Falls back to the CPU delegate when the
+                         GPU delegate cannot be created (e.g. unsupported
+                         platform or driver).
+            detect_every: Run inference on every Nth frame only; frames in
+                         between get the previous result back (a hand does
+                         not change pose between two camera frames).
+                         0 = adaptive: N follows the measured inference
+                         time against frame_budget, from 1 up to 3.
+            frame_budget: Seconds per camera frame, used by detect_every=0.
+        """
+        # Resolve model file (waiting for the import-time prefetch if needed)
         if model_path is None:
-            model_path = str(Path(__file__).parent.parent / 'hand_landmarker.task')
-
-        base_options = mp_python.BaseOptions(model_asset_path=model_path)
-        options = mp_vision.HandLandmarkerOptions(
-            base_options=base_options,
-            running_mode=mp_vision.RunningMode.VIDEO,
-            num_hands=max_num_hands,
-            min_hand_detection_confidence=min_detection_confidence,
-            min_hand_presence_confidence=min_tracking_confidence,
-            min_tracking_confidence=min_tracking_confidence,
+            if _prefetch_thread is not None:
+                _prefetch_thread.join()
+            model_path = str(_MODEL_PATH)
+
+        self._live_stream = live_stream
+        self._detect_size = detect_size
+
+        self._use_opencl    = use_opencl and cv2.ocl.haveOpenCL()
+        if self._use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        self._result_lock = threading.Lock()
+        self._latest_result = mp_vision.HandLandmarkerResult(
+            handedness=[], hand_landmarks=[], hand_world_landmarks=[],
         )
-        self._detector = mp_vision.HandLandmarker.create_from_options(options)
-        self._frame_ts: int = 0   # monotonic timestamp in ms
+
+        mode_kwargs: dict = {'running_mode': mp_vision.RunningMode.VIDEO}
+        if live_stream:
+            mode_kwargs = {
+                'running_mode':    mp_vision.RunningMode.LIVE_STREAM,
+                'result_callback': self._on_result,
+            }
+
+        def make_options(delegate):
+            return mp_vision.HandLandmarkerOptions(
+                base_options=mp_python.BaseOptions(
+                    model_asset_path=model_path, delegate=delegate,
+                ),
+                num_hands=max_num_hands,
+                min_hand_detection_confidence=min_detection_confidence,
+                min_hand_presence_confidence=min_tracking_confidence,
+                min_tracking_confidence=min_tracking_confidence,
+                **mode_kwargs,
+            )
+
+        Delegate = mp_python.BaseOptions.Delegate
+        self._detector = None
+        if use_gpu:
+            try:
+                self._detector = mp_vision.HandLandmarker.create_from_options(
+                    make_options(Delegate.GPU)
+                )
+            except (RuntimeError, ValueError, NotImplementedError) as exc:
+                print(f'[HandTracker] GPU delegate unavailable ({exc}) — using CPU')
+        if self._detector is None:
+            self._detector = mp_vision.HandLandmarker.create_from_options(
+                make_options(Delegate.CPU)
+            )
+        self._detector_lock = threading.Lock()
+        self._t0 = time.monotonic()
+        self._frame_ts: int = 0   # ms since _t0, strictly increasing
+
+        # Frame decimation (see detect_every)
+        self._detect_every = detect_every
+        self._frame_budget = frame_budget
+        self._skip_left    = 0
+        self._last_detection = None
+        self._infer_time   = 0.0   # EWMA of inference seconds (adaptive mode)
+
+        # Reusable resize / RGB scratch buffers (allocated on the first frame)
+        self._small_buf: np.ndarray | None = None
+        self._rgb_buf: np.ndarray | None = None
+
+        # Finger-state panel: 10 pre-rasterised row strips, stacked into one
+        # sprite per 5-bit mask on first use
+        self._state_rows = self._build_state_rows()
+        self._state_sprites: dict[int, Sprite] = {}
+
+        # (21, 3) arrays of the last parsed result, reused by draw_landmarks()
+        self._last_result = None
+        self._last_arrays: list[np.ndarray] = []
 
     # ------------------------------------------------------------------
     # Detection
     # ------------------------------------------------------------------
 
-    def detect_hands(self, frame):
+    def detect_hands(self, frame, capture_time: float | None = None):
         """
         Run MediaPipe inference on a BGR frame.
         Returns the raw HandLandmarkerResult object.
+
+        Args:
+            capture_time: time.monotonic() at which the frame was captured
+                          (e.g. Camera.last_frame_time).  Gives MediaPipe the
+                          real inter-frame spacing; defaults to "now".
+
+        In live-stream mode the frame is only submitted and the latest
+        completed result (usually from a previous frame) is returned.
         """
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
-        self._frame_ts += 33   # ~30 fps heartbeat (must be strictly increasing)
-        result = self._detector.detect_for_video(mp_image, self._frame_ts)
+        if self._skip_left > 0:
+            self._skip_left -= 1
+            return self.get_latest_result() if self._live_stream else self._last_detection
+        if self._live_stream:
+            self.submit_frame(frame, capture_time)
+            self._skip_left = max(self._detect_every, 1) - 1
+            return self.get_latest_result()
+
+        t_start  = time.perf_counter()
+        mp_image = self._to_mp_image(frame)
+        with self._detector_lock:
+            result = self._detector.detect_for_video(
+                mp_image, self._next_timestamp(capture_time),
+            )
+        self._last_detection = result
+        self._skip_left = self._frames_to_skip(time.perf_counter() - t_start)
         return result
 
+    def _frames_to_skip(self, infer_time: float) -> int:
+        """How many upcoming frames reuse the result just computed."""
+        if self._detect_every > 0:
+            return self._detect_every - 1
+        if not self._frame_budget:
+            return 0
+        self._infer_time = 0.8 * self._infer_time + 0.2 * infer_time
+        return min(max(math.ceil(self._infer_time / self._frame_budget), 1), 3) - 1
+
+    def submit_frame(self, frame, capture_time: float | None = None) -> None:
+        """Queue a BGR frame for async inference (live-stream mode only)."""
+        mp_image = self._to_mp_image(frame)
+        with self._detector_lock:
+            self._detector.detect_async(mp_image, self._next_timestamp(capture_time))
+
+    def _next_timestamp(self, capture_time: float | None = None) -> int:
+        """
+        Milliseconds since the tracker was created for the next detector call,
+        nudged forward when needed so it is strictly increasing as MediaPipe
+        requires.
+        """
+        t = time.monotonic() if capture_time is None else capture_time
+        self._frame_ts = max(self._frame_ts + 1, int((t - self._t0) * 1000))
+        return self._frame_ts
+
+    def get_latest_result(self):
+        """Return the most recent HandLandmarkerResult delivered by MediaPipe."""
+        with self._result_lock:
+            return self._latest_result
+
+    def _on_result(self, result, image, timestamp_ms: int) -> None:
+        """LIVE_STREAM callback — runs on a MediaPipe worker thread."""
+        with self._result_lock:
+            self._latest_result = result
+
+    def _to_mp_image(self, frame):
+        """
+        Downscale (if needed) and convert BGR → RGB into reusable buffers,
+        then wrap the result for MediaPipe.
+        """
+        size = self._detect_dims(frame)
+        if self._use_opencl:
+            src = cv2.UMat(frame)
+            if size is not None:
+                src = cv2.resize(src, size, interpolation=cv2.INTER_AREA)
+            self._rgb_buf = cv2.cvtColor(src, cv2.COLOR_BGR2RGB).get()
+            return mp.Image(image_format=mp.ImageFormat.SRGB, data=self._rgb_buf)
+        if size is not None:
+            if self._small_buf is None or self._small_buf.shape[1::-1] != size:
+                self._small_buf = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            cv2.resize(frame, size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+            frame = self._small_buf
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        return mp.Image(image_format=mp.ImageFormat.SRGB, data=self._rgb_buf)
+
+    def _detect_dims(self, frame) -> tuple[int, int] | None:
+        """(width, height) to downscale frame to for inference, or None."""
+        h, w = frame.shape[:2]
+        short = min(h, w)
+        if not 0 < self._detect_size < short:
+            return None
+        scale = self._detect_size / short
+        return round(w * scale), round(h * scale)
+
     def get_hands_info(self, results) -> dict:
         """
         Parse HandLandmarkerResult into a structured dict:
@@ -112,8 +410,11 @@ class HandTracker:
         }
 
         Each hand_data dict has:
-            'landmarks'    : list of (x, y, z) normalised coords
-            'finger_states': dict of finger→bool (True = extended)
+            'landmarks'    : (21, 3) float32 array of normalised x, y, z
+            'finger_mask'  : int, 5-bit packed finger states
+                             (bit 0 = thumb … bit 4 = pinky, 1 = extended)
+            'finger_states': read-only dict of finger→bool view of the mask
+            'gesture'      : gesture name for the mask ('Unknown' if none)
             'handedness'   : 'Left' | 'Right'
         """
         info: dict = {'count': 0, 'left': None, 'right': None}
@@ -121,18 +422,11 @@ class HandTracker:
         if not results.hand_landmarks:
             return info
 
-        for lm_list, handedness_list in zip(
-            results.hand_landmarks, results.handedness
-        ):
-            label: str = handedness_list[0].category_name  # 'Left' or 'Right'
-            finger_states = self._get_finger_states(lm_list)
-            landmarks_tuple = [(lm.x, lm.y, lm.z) for lm in lm_list]
+        arrays = self._landmark_arrays(results)
 
-            hand_data = {
-                'landmarks':     landmarks_tuple,
-                'finger_states': finger_states,
-                'handedness':    label,
-            }
+        for lm_arr, handedness_list in zip(arrays, results.handedness):
+            label: str = handedness_list[0].category_name  # 'Left' or 'Right'
+            hand_data  = self._hand_data(lm_arr, label)
 
             info['count'] += 1
             if label == 'Right':
@@ -142,100 +436,149 @@ class HandTracker:
 
         return info
 
-    # ------------------------------------------------------------------
-    # Finger state detection
-    # ------------------------------------------------------------------
-
-    def _get_finger_states(self, lm_list) -> dict:
+    def get_primary_hand(self, results) -> dict | None:
         """
-        Determine which fingers are extended (True) or curled (False).
-
-        Thumb  : extended when x-distance tip→wrist > ip→wrist
-        Others : extended when tip.y < pip.y (tip is higher on screen)
+        hand_data (see get_hands_info) for the right hand, else the left
+        hand, else None.  Only the chosen hand is classified.
         """
-        states: dict = {}
-
-        # --- Thumb ---
-        wrist     = lm_list[0]
-        thumb_tip = lm_list[4]
-        thumb_ip  = lm_list[3]
-        states['thumb'] = abs(thumb_tip.x - wrist.x) > abs(thumb_ip.x - wrist.x)
-
-        # --- Index, Middle, Ring, Pinky ---
-        for name, tip_id, pip_id in [
-            ('index',  8,  6),
-            ('middle', 12, 10),
-            ('ring',   16, 14),
-            ('pinky',  20, 18),
-        ]:
-            states[name] = lm_list[tip_id].y < lm_list[pip_id].y
+        if not results.hand_landmarks:
+            return None
+        labels = [h[0].category_name for h in results.handedness]
+        for want in ('Right', 'Left'):
+            if want in labels:
+                # Last match, as get_hands_info lets later hands overwrite
+                i = len(labels) - 1 - labels[::-1].index(want)
+                return self._hand_data(self._landmark_arrays(results)[i], want)
+        return None
+
+    @staticmethod
+    def _hand_data(lm_arr: np.ndarray, label: str) -> dict:
+        """Classify one (21, 3) landmark array into a hand_data dict."""
+        # One native call: finger bits + gesture-table lookup
+        finger_mask, gesture_id = _fast.mask_and_gesture(lm_arr, GESTURE_ID_BY_MASK)
+        finger_mask = int(finger_mask)
+        return {
+            'landmarks':     lm_arr,
+            'finger_mask':   finger_mask,
+            'finger_states': _STATES_BY_MASK[finger_mask],
+            'gesture':       GESTURE_NAMES[gesture_id],
+            'handedness':    label,
+        }
 
-        return states
+    def _landmark_arrays(self, results) -> list[np.ndarray]:
+        """(21, 3) float32 landmark arrays for results, built once per result."""
+        if results is not self._last_result:
+            self._last_arrays = [_landmarks_to_array(lm) for lm in results.hand_landmarks]
+            self._last_result = results
+        return self._last_arrays
 
     # ------------------------------------------------------------------
     # Visualisation
     # ------------------------------------------------------------------
 
-    def draw_landmarks(self, frame, results):
-        """Draw hand skeleton connections and coloured landmark dots."""
+    def draw_landmarks(self, frame, results, outline: bool = True):
+        """
+        Draw hand skeleton connections and coloured landmark dots.
+
+        Args:
+            outline: Ring each dot in white.  Turning it off halves the
+                     anti-aliased circle rasterisations (21 instead of 42
+                     per hand).
+        """
         if not results.hand_landmarks:
             return frame
 
         h, w = frame.shape[:2]
 
-        for lm_list in results.hand_landmarks:
-            pts = [(int(lm.x * w), int(lm.y * h)) for lm in lm_list]
+        for lm_arr in self._landmark_arrays(results):
+            pts = _fast.project_landmarks(lm_arr, w, h)
 
-            # Connections
-            for a, b in _HAND_CONNECTIONS:
-                cv2.line(frame, pts[a], pts[b], (180, 180, 180), 1, cv2.LINE_AA)
+            # Connections — every bone segment in one polylines call
+            cv2.polylines(frame, pts[self._CONN], False, (180, 180, 180), 1, cv2.LINE_AA)
 
             # Landmark dots coloured by finger group
-            for group, ids in _TIP_GROUPS.items():
-                colour = _LANDMARK_COLOURS[group]
-                for idx in ids:
-                    cv2.circle(frame, pts[idx], 5, colour, -1, cv2.LINE_AA)
-                    cv2.circle(frame, pts[idx], 5, (255, 255, 255), 1, cv2.LINE_AA)
+            pts_list = pts.tolist()
+            for idx, colour in self._DOTS:
+                cv2.circle(frame, pts_list[idx], 5, colour, -1, cv2.LINE_AA)
+                if outline:
+                    cv2.circle(frame, pts_list[idx], 5, (255, 255, 255), 1, cv2.LINE_AA)
 
         return frame
 
     def display_hand_detection(self, frame, hands_info: dict):
         """Render hand count badge in the top-right corner."""
         h, w = frame.shape[:2]
-        text = f"Hands: {hands_info['count']}"
-        cv2.putText(
-            frame, text, (w - 150, 30),
-            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2, cv2.LINE_AA,
+        sprite, dx, dy = text_sprite(
+            f"Hands: {hands_info['count']}", 0.6, (255, 255, 0), 2, cv2.LINE_AA,
         )
-        for key, colour in [('right', (0, 255, 100)), ('left', (100, 200, 255))]:
-            if hands_info.get(key):
-                lms = hands_info[key]['landmarks']
-                wx = int(lms[0][0] * w)
-                wy = int(lms[0][1] * h) + 20
-                cv2.putText(
-                    frame, key.upper(), (wx - 20, wy),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, colour, 2, cv2.LINE_AA,
-                )
+        sprite.blit(frame, w - 150 + dx, 30 + dy)
+        for key, label, colour in self._SIDE_BADGES:
+            hand = hands_info.get(key)
+            if hand:
+                lms = hand['landmarks']
+                wx = int(lms[0, 0] * w)
+                wy = int(lms[0, 1] * h) + 20
+                sprite, dx, dy = text_sprite(label, 0.5, colour, 2, cv2.LINE_AA)
+                sprite.blit(frame, wx - 20 + dx, wy + dy)
         return frame
 
-    def display_finger_states(self, frame, finger_states: dict):
-        """Render finger up/down states in the bottom-left corner."""
-        h = frame.shape[0]
-        y = h - 150
-        for name, up in finger_states.items():
-            colour = (0, 255, 0) if up else (0, 0, 220)
-            label  = f'{name}: {"UP" if up else "DOWN"}'
-            cv2.putText(
-                frame, label, (10, y),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.48, colour, 1, cv2.LINE_AA,
-            )
-            y += 26
+    def display_finger_states(self, frame, finger_states):
+        """
+        Render finger up/down states in the bottom-left corner.
+
+        Args:
+            finger_states: 5-bit finger mask, or a finger→bool dict.
+        """
+        if isinstance(finger_states, (int, np.integer)):
+            mask = int(finger_states) & 0b11111
+        else:
+            mask = sum(1 << i for i, name in enumerate(_FINGER_NAMES)
+                       if finger_states.get(name))
+
+        sprite = self._state_sprites.get(mask)
+        if sprite is None:
+            sprite = self._render_state_sprite(mask)
+            self._state_sprites[mask] = sprite
+
+        sprite.blit(frame, 10, frame.shape[0] - 150 - self._STATE_TOP)
         return frame
 
+    def _render_state_sprite(self, mask: int) -> Sprite:
+        """Stack the five cached row strips for one mask into a panel sprite."""
+        rows   = [self._state_rows[name, up] for name, up in _STATES_BY_MASK[mask].items()]
+        sprite = Sprite(rows[0].width, len(rows) * self._STATE_ROW_STEP)
+        sprite.image = np.concatenate([r.image for r in rows])
+        sprite.alpha = np.concatenate([r.alpha for r in rows])
+        return sprite
+
+    @classmethod
+    def _build_state_rows(cls) -> dict[tuple[str, bool], Sprite]:
+        """Rasterise the 10 '<finger>: UP/DOWN' strips once (equal widths)."""
+        labels = {
+            (name, up): (f'{name}: {"UP" if up else "DOWN"}',
+                         (0, 255, 0) if up else (0, 0, 220))
+            for name in _FINGER_NAMES for up in (True, False)
+        }
+        width = max(cv2.getTextSize(t, cv2.FONT_HERSHEY_SIMPLEX, 0.48, 1)[0][0]
+                    for t, _ in labels.values()) + 2
+
+        rows: dict[tuple[str, bool], Sprite] = {}
+        for key, (text, colour) in labels.items():
+            strip = Sprite(width, cls._STATE_ROW_STEP)
+            cover = np.zeros((cls._STATE_ROW_STEP, width), dtype=np.uint8)
+            cv2.putText(strip.image, text, (0, cls._STATE_TOP),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.48, colour, 1, cv2.LINE_AA)
+            cv2.putText(cover, text, (0, cls._STATE_TOP),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.48, 255, 1, cv2.LINE_AA)
+            strip.set_alpha_from_mask(cover)
+            rows[key] = strip
+        return rows
+
     # ------------------------------------------------------------------
     # Cleanup
     # ------------------------------------------------------------------
 
     def close(self) -> None:
         """Release MediaPipe resources."""
-        self._detector.close()
+        with self._detector_lock:
+            self._detector.close()
@@ -31,6 +31,8 @@ import time
 from dataclasses import dataclass
 from datetime    import datetime
 
+import numpy as np
+
 
 # ---------------------------------------------------------------------------
 # Win32 mouse-event flags
@@ -117,7 +119,7 @@ class AirMouseController:
 
     def update(
         self,
-        landmarks:     list[tuple[float, float, float]],
+        landmarks:     np.ndarray | list[tuple[float, float, float]],
         finger_states: dict,
         gesture:       str | None,
         frame_w:       int,
@@ -128,7 +130,7 @@ class AirMouseController:
 
         Parameters
         ----------
-        landmarks     : Normalised (x, y, z) tuples, one per landmark (21 total).
+        landmarks     : (21, 3) array (or sequence of tuples) of normalised x, y, z.
         finger_states : Dict from HandTracker  {thumb/index/middle/ring/pinky: bool}.
         gesture       : Classified gesture name, or None.
         frame_w, frame_h : Camera frame pixel dimensions (landmarks are normalised).
@@ -138,7 +140,7 @@ class AirMouseController:
         str | None
             Human-readable label of the action taken this frame, or None.
         """
-        if not landmarks:
+        if landmarks is None or len(landmarks) == 0:
             self._smooth_x     = None
             self._smooth_y     = None
             self._scroll_ref_y = None
@@ -185,9 +187,9 @@ class AirMouseController:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _move_cursor(self, landmarks: list) -> str | None:
+    def _move_cursor(self, landmarks) -> str | None:
         lm = landmarks[self._CURSOR_LM]
-        raw_x, raw_y = lm[0], lm[1]
+        raw_x, raw_y = float(lm[0]), float(lm[1])
 
         # Map [margin, 1−margin] → [0, screen_w/h]; clamp to screen edges
         m     = self._margin
@@ -214,9 +216,9 @@ class AirMouseController:
         ctypes.windll.user32.SetCursorPos(sx, sy)
         return None     # continuous movement — suppress per-frame log spam
 
-    def _scroll(self, landmarks: list) -> str | None:
+    def _scroll(self, landmarks) -> str | None:
         lm    = landmarks[self._CURSOR_LM]
-        cur_y = lm[1]
+        cur_y = float(lm[1])
 
         if self._scroll_ref_y is None:
             self._scroll_ref_y = cur_y
@@ -354,6 +356,7 @@ class SystemModeEngine:
         should_execute       = self._activation.update(gesture)
         if not should_execute:
             action = None
+        self._activation.flush_events()
         return ModeEngineResult(
             action         = action,
             mode_changed   = mode_changed,
@@ -1,8 +1,9 @@
 """
 Module: action_executor.py
 Description: Executes system actions resolved by the DecisionEngine — launches
-             applications, sends media/volume keyboard events via pyautogui,
-             and logs each action with a human-readable label.
+             applications, sends media/volume keyboard events (user32 on
+             Windows, pyautogui elsewhere), and logs each action with a
+             human-readable label.
 Author: Pratham Chaturvedi
 
 engine/action_executor.py - The Action Performer
@@ -15,17 +16,24 @@ the DecisionEngine:
     - Volume control       (up / down / mute)
 
 Uses:
-    subprocess  – launch applications
-    pyautogui   – send media / volume keyboard events
-    os          – expand environment variables in paths
+    os.startfile – launch applications / Store apps (Windows)
+    subprocess   – launch applications (other platforms)
+    ctypes       – send media / volume keys via user32.keybd_event (Windows)
+    pyautogui    – send media / volume keyboard events (fallback)
+    os           – expand environment variables in paths
 
 Displays a fading on-screen notification for each action executed.
 """
 
+import ctypes
 import os
 import time
 import subprocess
+from collections.abc import Callable
 import cv2
+import numpy as np
+
+from utils.overlay import tint_rect
 
 try:
     import pyautogui
@@ -35,6 +43,25 @@ except ImportError:
     _PYAUTOGUI = False
     print('[ActionExecutor] Warning: pyautogui not installed — media/volume keys disabled')
 
+# Direct user32 access for media keys (Windows only): one keybd_event pair
+# per press instead of pyautogui's name lookup + failsafe + SendInput path.
+try:
+    _USER32 = ctypes.WinDLL('user32', use_last_error=True)
+except (AttributeError, OSError):
+    _USER32 = None
+
+_KEYEVENTF_KEYUP = 0x0002
+
+# Virtual-key codes for the pyautogui key names used in _KEY_MAP
+_VK_CODES: dict[str, int] = {
+    'nexttrack':  0xB0,
+    'prevtrack':  0xB1,
+    'playpause':  0xB3,
+    'volumeup':   0xAF,
+    'volumedown': 0xAE,
+    'volumemute': 0xAD,
+}
+
 
 class ActionExecutor:
     """Executes system actions and shows brief on-screen feedback."""
@@ -82,6 +109,24 @@ class ActionExecutor:
         # Per-action cooldown tracking: action → timestamp of last execution
         self._last_executed: dict[str, float] = {}
 
+        # Action ID → zero-arg handler, built once.  Handlers look up the
+        # helper methods at call time, so only known action IDs can run.
+        self._dispatch: dict[str, Callable[[], None]] = {
+            'open_brave':       lambda: self._launch(self._brave_path),
+            'open_apple_music': lambda: self._launch_store_app(self._apple_music_aumid),
+            **{
+                action: (lambda key=key: self._press(key))
+                for action, key in self._KEY_MAP.items()
+            },
+        }
+
+        # Action ID → banner (width, height, coverage); the label set is
+        # fixed, so every banner is rasterised once up front
+        self._banners: dict[str, tuple[int, int, np.ndarray]] = {
+            action: self._render_banner(f'Action: {label}')
+            for action, label in self._LABELS.items()
+        }
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -101,16 +146,10 @@ class ActionExecutor:
         label = self._LABELS.get(action, action)
         print(f'  [{action}] {label}')
 
+        handler = self._dispatch.get(action)
         try:
-            if action == 'open_brave':
-                self._launch(self._brave_path)
-
-            elif action == 'open_apple_music':
-                self._launch_store_app(self._apple_music_aumid)
-
-            elif action in self._KEY_MAP:
-                self._press(self._KEY_MAP[action])
-
+            if handler is not None:
+                handler()
             else:
                 print(f'  [ActionExecutor] Unknown action: {action}')
 
@@ -124,33 +163,52 @@ class ActionExecutor:
 
         elapsed = time.time() - self._last_action_time
         if elapsed > self._FEEDBACK_DURATION:
+            self._last_action = None   # banner done — later frames exit on the check above
             return frame
 
         # Alpha fades from 1 → 0 over the display duration
         alpha = max(0.0, 1.0 - (elapsed / self._FEEDBACK_DURATION))
-        label = self._LABELS.get(self._last_action, self._last_action)
-        text  = f'Action: {label}'
 
         h, w = frame.shape[:2]
-        (tw, th), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.75, 2)
+        banner = self._banners.get(self._last_action)
+        if banner is None:
+            banner = self._render_banner(f'Action: {self._last_action}')
+            self._banners[self._last_action] = banner
+        tw, th, cover = banner
         x = (w - tw) // 2
         y = h - 35
 
-        # Background bar
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (x - 10, y - th - 8), (x + tw + 10, y + 8),
-                      (20, 20, 20), -1)
-        cv2.addWeighted(overlay, alpha * 0.75, frame, 1 - alpha * 0.75, 0, frame)
+        # Background bar (blended in place — only the bar is touched).
+        # Opacity is quantised to 1/31 steps so the whole fade stays within
+        # tint_rect's 32-entry LUT cache instead of missing on every frame.
+        tint_rect(frame, (x - 10, y - th - 8), (x + tw + 10, y + 8),
+                  (20, 20, 20), round(alpha * 0.75 * 31) / 31)
 
-        # Text with fade
+        # Text with fade — blend the cached coverage mask, no rasterising
         intensity = int(255 * alpha)
-        cv2.putText(
-            frame, text, (x, y),
-            cv2.FONT_HERSHEY_SIMPLEX, 0.75,
-            (intensity, intensity, intensity), 2, cv2.LINE_AA,
-        )
+        x0, y0 = x - 10, y - th - 8
+        fx0, fy0 = max(x0, 0), max(y0, 0)
+        fx1, fy1 = min(x0 + cover.shape[1], w), min(y0 + cover.shape[0], h)
+        if fx0 < fx1 and fy0 < fy1:
+            c   = cover[fy0 - y0:fy1 - y0, fx0 - x0:fx1 - x0]
+            roi = frame[fy0:fy1, fx0:fx1]
+            np.copyto(roi, roi + (intensity - roi.astype(np.float32)) * c + 0.5,
+                      casting='unsafe')
         return frame
 
+    @staticmethod
+    def _render_banner(text: str) -> tuple[int, int, np.ndarray]:
+        """
+        Measure text and rasterise its anti-aliased coverage (0–1 float) over
+        the banner rectangle, whose top-left is 10 px left of and th + 8 px
+        above the text origin.
+        """
+        (tw, th), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.75, 2)
+        mask = np.zeros((th + 17, tw + 21), dtype=np.uint8)
+        cv2.putText(mask, text, (10, th + 8),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.75, 255, 2, cv2.LINE_AA)
+        return tw, th, mask[..., None].astype(np.float32) / 255.0
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
@@ -159,19 +217,26 @@ class ActionExecutor:
         """Launch an application by absolute path."""
         expanded = os.path.expandvars(path)
         if os.path.exists(expanded):
-            subprocess.Popen([expanded])
+            if os.name == 'nt':
+                os.startfile(expanded)   # ShellExecuteEx — no handle inheritance
+            else:
+                subprocess.Popen([expanded], close_fds=True, start_new_session=True)
             print(f'  [ActionExecutor] Launched: {expanded}')
         else:
             print(f'  [ActionExecutor] Application not found: {expanded}')
 
     def _launch_store_app(self, aumid: str) -> None:
         """Launch a Microsoft Store app by its Application User Model ID."""
-        subprocess.Popen(['explorer.exe', f'shell:AppsFolder\\{aumid}'])
+        os.startfile(f'shell:AppsFolder\\{aumid}')
         print(f'  [ActionExecutor] Launched Store app: {aumid}')
 
     def _press(self, key: str) -> None:
-        """Send a keyboard event via pyautogui."""
-        if _PYAUTOGUI:
+        """Send a keyboard event via user32 (Windows) or pyautogui."""
+        vk = _VK_CODES.get(key)
+        if _USER32 is not None and vk is not None:
+            _USER32.keybd_event(vk, 0, 0, 0)
+            _USER32.keybd_event(vk, 0, _KEYEVENTF_KEYUP, 0)
+        elif _PYAUTOGUI:
             pyautogui.press(key)
         else:
             print(f'  [ActionExecutor] pyautogui unavailable — cannot press "{key}"')
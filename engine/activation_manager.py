@@ -11,46 +11,131 @@ Manages the system's active/inactive state with multiple safety layers:
 
     • Activation   : hold "Open Palm" for 2 seconds (no accidental triggers)
     • Deactivation : show "Fist" for instant off
-    • Stability    : gesture must be consistent for ≥ 10 frames
+    • Stability    : gesture must fill ≥ 80 % of the last 11 frames
+                     (a new gesture fires after 3 consecutive frames)
     • Cooldown     : 1-second wait between actions (prevents rapid repeats)
     • Visual panel : always shows INACTIVE / ACTIVATING / ACTIVE with a
                      progress bar during the activation countdown
 """
 
+import math
+import sys
 import time
+from collections import OrderedDict, deque
+from enum import IntEnum
+
 import cv2
+import numpy as np
+
+from utils.overlay import Sprite
+
+
+class _State(IntEnum):
+    INACTIVE   = 0
+    ACTIVATING = 1
+    ACTIVE     = 2
+
+
+_STATE_LABELS = ('INACTIVE', 'ACTIVATING', 'ACTIVE')   # display text, by _State
 
 
 class ActivationManager:
     """State machine that gates gesture execution behind a safety protocol."""
 
-    STATE_INACTIVE   = 'INACTIVE'
-    STATE_ACTIVATING = 'ACTIVATING'
-    STATE_ACTIVE     = 'ACTIVE'
+    STATE_INACTIVE   = _State.INACTIVE
+    STATE_ACTIVATING = _State.ACTIVATING
+    STATE_ACTIVE     = _State.ACTIVE
 
     # Gestures that should never trigger an action (system-only)
     _SYSTEM_GESTURES = frozenset({'Open Palm', 'Fist', 'Unknown', 'Thumbs Up'})
 
+    # Gesture → transition class; anything not listed is an 'action' gesture.
+    # Keys are interned, like the labels core.gesture_classifier hands out,
+    # so the per-frame lookup matches by identity.
+    _GESTURE_CLASS: dict[str, str] = {
+        sys.intern('Open Palm'): 'palm',
+        sys.intern('Fist'):      'fist',
+        **{sys.intern(g): 'system' for g in _SYSTEM_GESTURES - {'Open Palm', 'Fist'}},
+    }
+
+    # Status panel geometry (bottom-left corner) and per-state label colour
+    _PANEL_X, _PANEL_BOTTOM = 10, 105
+    _PANEL_W, _PANEL_H      = 260, 90
+    _PANEL_CACHE_SIZE       = 32
+
+    # Bounds for the adaptive cooldown (seconds)
+    _MIN_COOLDOWN, _MAX_COOLDOWN = 0.15, 1.5
+    _STATE_COLOURS = (
+        (60,  60, 220),    # INACTIVE
+        (20, 200, 255),    # ACTIVATING
+        (30, 210,  40),    # ACTIVE
+    )
+
     def __init__(
         self,
         open_palm_duration: float = 2.0,
         cooldown_duration:  float = 1.0,
         stability_threshold: int  = 10,
+        stability_ratio:   float  = 0.8,
+        leading_frames:      int  = 3,
+        adaptive_cooldown:  bool  = False,
     ):
         self._open_palm_duration  = open_palm_duration
         self._cooldown_duration   = cooldown_duration
+        self._adaptive_cooldown   = adaptive_cooldown
+        self._cooldown            = cooldown_duration   # effective (may adapt)
         self._stability_threshold = stability_threshold
 
-        # State tracking
-        self._state: str            = self.STATE_INACTIVE
+        # State tracking (all times are time.perf_counter() seconds)
+        self._state: _State         = self.STATE_INACTIVE
         self._activation_start: float | None = None
-        self._last_action_time: float        = 0.0
-
-        # Stability tracking
-        self._last_gesture: str | None = None
-        self._stable_count: int        = 0
+        self._last_action_time: float        = float('-inf')
+        self._now: float = time.perf_counter()   # clock sampled once per update()
+
+        # Adaptive cooldown: EWMA of the gaps between separate gestures.
+        # Repeats of a held gesture are spaced by the cooldown itself, so
+        # learning from them would only ever shrink it.
+        self._last_trigger_time: float = float('-inf')
+        self._ewma_gap: float = cooldown_duration
+        self._released: bool = True   # gesture changed since the last trigger
+
+        # Stability voting: a gesture is stable once it fills at least
+        # stability_ratio of the last stability_threshold + 1 frames, so a
+        # single flickered frame no longer restarts the count.
+        window = stability_threshold + 1
+        self._gesture_ring: deque[str | None] = deque(maxlen=window)
+        self._gesture_votes: dict[str | None, int] = {}
+        self._votes_needed = max(1, math.ceil(stability_ratio * window))
         self._last_triggered: str | None = None  # last gesture that fired
 
+        # Leading edge: a gesture other than the last one fired only needs
+        # leading_frames consecutive frames; repeats use the full vote.
+        self._leading_frames = min(leading_frames, self._votes_needed)
+        self._run_gesture: str | None = None
+        self._run_length: int = 0
+
+        # Set False (e.g. while the preview window is hidden) to skip drawing
+        self.render_enabled: bool = True
+
+        # State-change messages, printed by flush_events() outside update()
+        self._events: deque[str] = deque(maxlen=32)
+
+        # (state, progress step, cooldown step) → rendered panel, LRU order
+        self._panel_cache: OrderedDict[tuple, Sprite] = OrderedDict()
+
+        # (state, gesture class) → handler(gesture, now, stable) -> fire?
+        # Pairs not listed leave the state untouched and never fire.
+        self._transitions = {
+            (self.STATE_INACTIVE,   'palm'):   self._begin_activation,
+            (self.STATE_ACTIVATING, 'palm'):   self._continue_activation,
+            (self.STATE_ACTIVATING, 'none'):   self._cancel_activation,
+            (self.STATE_ACTIVATING, 'fist'):   self._cancel_activation,
+            (self.STATE_ACTIVATING, 'system'): self._cancel_activation,
+            (self.STATE_ACTIVATING, 'action'): self._cancel_activation,
+            (self.STATE_ACTIVE,     'fist'):   self._deactivate,
+            (self.STATE_ACTIVE,     'action'): self._try_trigger,
+        }
+
     # ------------------------------------------------------------------
     # Properties
     # ------------------------------------------------------------------
@@ -61,11 +146,29 @@ class ActivationManager:
 
     @property
     def is_in_cooldown(self) -> bool:
-        return (time.time() - self._last_action_time) < self._cooldown_duration
+        """Cooldown status as of the latest update() call."""
+        return (self._now - self._last_action_time) < self._cooldown
 
     @property
     def state(self) -> str:
-        return self._state
+        return _STATE_LABELS[self._state]
+
+    @property
+    def cooldown(self) -> float:
+        """Current cooldown in seconds (varies when adaptive_cooldown is on)."""
+        return self._cooldown
+
+    def flush_events(self, emit=print) -> None:
+        """
+        Emit queued state-change messages; call once per frame, off the hot path.
+
+        emit receives all pending messages joined into one string (print by
+        default; pass e.g. a logger's .info to route them elsewhere).
+        """
+        events = self._events
+        if events:
+            emit('\n'.join(events))
+            events.clear()
 
     # ------------------------------------------------------------------
     # Main update — called once per frame
@@ -79,124 +182,156 @@ class ActivationManager:
         steadily and the system is active + not in cooldown.
         The caller should execute the corresponding action on True.
         """
-        now = time.time()
-
-        # ---- Stability counter ----------------------------------------
-        if gesture == self._last_gesture:
-            self._stable_count += 1
+        now = self._now = time.perf_counter()
+
+        # ---- Stability vote (sliding window) ---------------------------
+        ring, votes = self._gesture_ring, self._gesture_votes
+        if len(ring) == ring.maxlen:
+            evicted = ring[0]
+            votes[evicted] -= 1
+        ring.append(gesture)
+        votes[gesture] = votes.get(gesture, 0) + 1
+
+        if gesture == self._run_gesture:
+            self._run_length += 1
         else:
-            self._stable_count = 0
-            self._last_gesture = gesture
+            self._run_gesture, self._run_length = gesture, 1
+        # A change counts as a release once it lasts leading_frames frames
+        if gesture != self._last_triggered and self._run_length >= self._leading_frames:
+            self._released = True
 
-        stable = self._stable_count >= self._stability_threshold
-
-        # ---- Handle None / no hand -------------------------------------
-        if gesture is None:
-            if self._state == self.STATE_ACTIVATING:
-                self._state = self.STATE_INACTIVE
-                self._activation_start = None
-            return False
+        stable = votes[gesture] >= self._votes_needed or (
+            gesture != self._last_triggered and self._run_length >= self._leading_frames
+        )
 
-        # ---- Activation flow ------------------------------------------
-        if gesture == 'Open Palm':
-            if self._state == self.STATE_INACTIVE:
-                self._state = self.STATE_ACTIVATING
-                self._activation_start = now
-
-            if self._state == self.STATE_ACTIVATING:
-                elapsed = now - self._activation_start
-                if elapsed >= self._open_palm_duration:
-                    self._state = self.STATE_ACTIVE
-                    self._last_action_time = now  # brief cooldown grace
-                    print('✓ System ACTIVATED')
-            return False
+        handler = self._transitions.get((self._state, self._gesture_class(gesture)))
+        return handler(gesture, now, stable) if handler is not None else False
 
-        # Open Palm gesture released — cancel activation countdown
-        if self._state == self.STATE_ACTIVATING:
-            self._state = self.STATE_INACTIVE
-            self._activation_start = None
+    # ------------------------------------------------------------------
+    # State transitions
+    # ------------------------------------------------------------------
 
-        # ---- Deactivation flow ----------------------------------------
-        if gesture == 'Fist' and self._state == self.STATE_ACTIVE:
-            self._state = self.STATE_INACTIVE
-            self._last_triggered = None
-            print('✕ System DEACTIVATED')
-            return False
+    def _gesture_class(self, gesture: str | None) -> str:
+        """Bucket a gesture into 'none' | 'palm' | 'fist' | 'system' | 'action'."""
+        if gesture is None:
+            return 'none'
+        return self._GESTURE_CLASS.get(gesture, 'action')
+
+    def _begin_activation(self, gesture, now: float, stable: bool) -> bool:
+        self._state = self.STATE_ACTIVATING
+        self._activation_start = now
+        return self._continue_activation(gesture, now, stable)
+
+    def _continue_activation(self, gesture, now: float, stable: bool) -> bool:
+        if now - self._activation_start >= self._open_palm_duration:
+            self._state = self.STATE_ACTIVE
+            self._last_action_time = now  # brief cooldown grace
+            self._events.append('✓ System ACTIVATED')
+        return False
 
-        # ---- Action trigger -------------------------------------------
-        if (
-            self._state == self.STATE_ACTIVE
-            and stable
-            and gesture not in self._SYSTEM_GESTURES
-            and not self.is_in_cooldown
-        ):
-            # Fire only when gesture changes OR cooldown fully elapsed
-            if gesture != self._last_triggered or (now - self._last_action_time) >= self._cooldown_duration:
-                self._last_triggered  = gesture
-                self._last_action_time = now
-                print(f'→ Stable gesture triggered: {gesture}')
-                return True
+    def _cancel_activation(self, gesture, now: float, stable: bool) -> bool:
+        # Open Palm released (or hand lost) before the countdown finished
+        self._state = self.STATE_INACTIVE
+        self._activation_start = None
+        return False
 
+    def _deactivate(self, gesture, now: float, stable: bool) -> bool:
+        self._state = self.STATE_INACTIVE
+        self._last_triggered = None
+        self._events.append('✕ System DEACTIVATED')
         return False
 
+    def _try_trigger(self, gesture, now: float, stable: bool) -> bool:
+        if not stable or (now - self._last_action_time) < self._cooldown:
+            return False
+        if self._adaptive_cooldown:
+            self._adapt_cooldown(now)
+        self._last_triggered   = gesture
+        self._last_action_time = now
+        self._events.append(f'→ Stable gesture triggered: {gesture}')
+        return True
+
+    def _adapt_cooldown(self, now: float) -> None:
+        """Track the pace of separate gestures; next cooldown = half the mean gap."""
+        gap = now - self._last_trigger_time
+        self._last_trigger_time = now
+        released, self._released = self._released, False
+        if gap == float('inf') or not released:
+            return   # first trigger, or a held gesture repeating — nothing to learn
+        self._ewma_gap = 0.7 * self._ewma_gap + 0.3 * gap
+        self._cooldown = min(max(self._ewma_gap * 0.5, self._MIN_COOLDOWN),
+                             self._MAX_COOLDOWN)
+
     # ------------------------------------------------------------------
     # Visualisation
     # ------------------------------------------------------------------
 
     def display_status(self, frame):
         """Draw a translucent status panel in the bottom-left corner."""
-        h, w = frame.shape[:2]
-
-        px, py = 10, h - 105
-        pw, ph = 260, 90
-
-        # Semi-transparent background
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (px, py), (px + pw, py + ph), (10, 10, 10), -1)
-        cv2.addWeighted(overlay, 0.55, frame, 0.45, 0, frame)
-        cv2.rectangle(frame, (px, py), (px + pw, py + ph), (80, 80, 80), 1)
-
-        # State colour and label
-        if self._state == self.STATE_INACTIVE:
-            colour = (60,  60, 220)
-            label  = 'INACTIVE'
-        elif self._state == self.STATE_ACTIVATING:
-            colour = (20, 200, 255)
-            label  = 'ACTIVATING'
+        if not self.render_enabled:
+            return frame
+
+        progress_step = cooldown_step = None
+
+        if self._state == self.STATE_ACTIVATING and self._activation_start is not None:
+            elapsed = self._now - self._activation_start
+            progress_step = round(min(elapsed / self._open_palm_duration, 1.0) * 20)
+
+        if self._state == self.STATE_ACTIVE and self.is_in_cooldown:
+            remaining = self._cooldown - (self._now - self._last_action_time)
+            cooldown_step = round(remaining * 10)
+
+        key = (self._state, progress_step, cooldown_step)
+        sprite = self._panel_cache.get(key)
+        if sprite is None:
+            sprite = self._render_panel(*key)
+            self._panel_cache[key] = sprite
+            if len(self._panel_cache) > self._PANEL_CACHE_SIZE:
+                self._panel_cache.popitem(last=False)
         else:
-            colour = (30, 210,  40)
-            label  = 'ACTIVE'
+            self._panel_cache.move_to_end(key)
 
-        cv2.putText(
-            frame, f'Status: {label}',
-            (px + 8, py + 28),
-            cv2.FONT_HERSHEY_SIMPLEX, 0.62, colour, 2, cv2.LINE_AA,
-        )
+        sprite.blit(frame, self._PANEL_X, frame.shape[0] - self._PANEL_BOTTOM)
+        return frame
 
-        # Progress bar (shown only while activating)
-        if self._state == self.STATE_ACTIVATING and self._activation_start:
-            elapsed  = time.time() - self._activation_start
-            progress = min(elapsed / self._open_palm_duration, 1.0)
+    @classmethod
+    def _render_panel(cls, state: _State, progress_step: int | None,
+                      cooldown_step: int | None) -> Sprite:
+        """Render one status panel (fill, border, label, bar) as a Sprite."""
+        pw, ph = cls._PANEL_W, cls._PANEL_H
+        sprite = Sprite(pw + 1, ph + 1)
+        img    = sprite.image
+        mask   = np.zeros(img.shape[:2], dtype=np.uint8)
+
+        def draw(fn, *args, colour, **kwargs):
+            fn(img, *args, colour, **kwargs)
+            fn(mask, *args, 255, **kwargs)
 
-            bx, by = px + 8, py + 45
+        draw(cv2.rectangle, (0, 0), (pw, ph), colour=(80, 80, 80), thickness=1)
+
+        colour = cls._STATE_COLOURS[state]
+        draw(cv2.putText, f'Status: {_STATE_LABELS[state]}', (8, 28),
+             cv2.FONT_HERSHEY_SIMPLEX, 0.62, colour=colour, thickness=2,
+             lineType=cv2.LINE_AA)
+
+        # Progress bar (shown only while activating)
+        if progress_step is not None:
+            progress = progress_step / 20
+            bx, by = 8, 45
             bw, bh = pw - 16, 14
 
-            cv2.rectangle(frame, (bx, by), (bx + bw, by + bh), (60, 60, 60), -1)
+            draw(cv2.rectangle, (bx, by), (bx + bw, by + bh), colour=(60, 60, 60), thickness=-1)
             fill = int(bw * progress)
-            cv2.rectangle(frame, (bx, by), (bx + fill, by + bh), (20, 200, 255), -1)
-            cv2.putText(
-                frame, f'{progress * 100:.0f}%',
-                (bx + bw // 2 - 14, by + bh - 2),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.38, (255, 255, 255), 1, cv2.LINE_AA,
-            )
+            draw(cv2.rectangle, (bx, by), (bx + fill, by + bh), colour=(20, 200, 255), thickness=-1)
+            draw(cv2.putText, f'{progress * 100:.0f}%', (bx + bw // 2 - 14, by + bh - 2),
+                 cv2.FONT_HERSHEY_SIMPLEX, 0.38, colour=(255, 255, 255), thickness=1,
+                 lineType=cv2.LINE_AA)
 
         # Cooldown indicator
-        if self._state == self.STATE_ACTIVE and self.is_in_cooldown:
-            remaining = self._cooldown_duration - (time.time() - self._last_action_time)
-            cv2.putText(
-                frame, f'Cooldown: {remaining:.1f}s',
-                (px + 8, py + 75),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.48, (255, 165, 0), 1, cv2.LINE_AA,
-            )
+        if cooldown_step is not None:
+            draw(cv2.putText, f'Cooldown: {cooldown_step / 10:.1f}s', (8, 75),
+                 cv2.FONT_HERSHEY_SIMPLEX, 0.48, colour=(255, 165, 0), thickness=1,
+                 lineType=cv2.LINE_AA)
 
-        return frame
+        sprite.set_layers(mask, (10, 10, 10), 0.55)
+        return sprite
@@ -26,9 +26,18 @@ System Mode : (empty — to be configured)
 """
 
 import json
+import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 # ---------------------------------------------------------------------------
@@ -68,6 +77,23 @@ ALLOWED_ACTIONS: frozenset[str] = frozenset({
 # Special sentinel stored in mode_switch map for cycling behaviour
 _NEXT_MODE = 'next_mode'
 
+_DEFAULT_MAP_PATH = Path(__file__).parent.parent / 'config' / 'gesture_map.json'
+
+
+@lru_cache(maxsize=4)
+def _read_gesture_map(path: str, mtime_ns: int) -> MappingProxyType:
+    """
+    Parse gesture_map.json once per (path, mtime) and share the result.
+
+    The mtime is part of the key so edits made from the UI are picked up by
+    the next engine constructed; the returned mapping is read-only.
+    """
+    if ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return MappingProxyType(orjson.loads(Path(path).read_bytes()))
+    with open(path, 'r', encoding='utf-8') as fh:
+        return MappingProxyType(json.load(fh))
+
 
 class DecisionEngine:
     """
@@ -101,7 +127,8 @@ class DecisionEngine:
     def __init__(self, config_path: str | Path | None = None):
         # Mode maps loaded from JSON
         self._mode_switch_map: dict[str, str]            = {}
-        self._action_maps:     dict[str, dict[str, str]] = {}
+        self._flat_actions:    dict[tuple[str, str], str] = {}   # (mode, gesture) → action
+        self._lookup_action = self._flat_actions.get             # rebound by _load_map
 
         # Runtime state
         self.current_mode: str = DEFAULT_MODE
@@ -113,9 +140,7 @@ class DecisionEngine:
         self._last_switch_time: float      = 0.0
 
         # Resolve config path
-        if config_path is None:
-            config_path = Path(__file__).parent.parent / 'config' / 'gesture_map.json'
-        self._load_map(Path(config_path))
+        self._load_map(_DEFAULT_MAP_PATH if config_path is None else Path(config_path))
 
     # ------------------------------------------------------------------
     # Primary public API
@@ -135,14 +160,15 @@ class DecisionEngine:
             self._reset_stability()
             return None, False
 
-        # --- Mode-switch path ---
-        if self.is_mode_switch(gesture):
-            mode_changed = self._update_mode_stability(gesture)
+        # --- Mode-switch path (one lookup resolves both "is it" and "to what") ---
+        raw_target = self._mode_switch_map.get(gesture)
+        if raw_target is not None:
+            mode_changed = self._update_mode_stability(raw_target)
             return None, mode_changed          # never an action for switch gestures
 
         # --- Normal action path ---
         self._reset_stability()
-        action = self.get_action(gesture, self.current_mode)
+        action = self._lookup_action((self.current_mode, gesture))
         return action, False
 
     def get_action(self, gesture: str, mode: str | None = None) -> str | None:
@@ -156,8 +182,7 @@ class DecisionEngine:
         Returns:
             Action string or None.
         """
-        target_mode = mode if mode is not None else self.current_mode
-        return self._action_maps.get(target_mode, {}).get(gesture)
+        return self._lookup_action((self.current_mode if mode is None else mode, gesture))
 
     def is_mode_switch(self, gesture: str) -> bool:
         """Return True if gesture is a mode-switch gesture (1/2/3 fingers)."""
@@ -186,15 +211,13 @@ class DecisionEngine:
     # Mode-switch stability logic (private)
     # ------------------------------------------------------------------
 
-    def _update_mode_stability(self, gesture: str) -> bool:
+    def _update_mode_stability(self, raw_target: str) -> bool:
         """
-        Track hold stability for mode-switch gestures.
+        Track hold stability for a mode-switch gesture's mapped target.
         Returns True when a mode switch is committed.
 
         Value 'next_mode' cycles: App Mode → Media Mode → System Mode → App Mode.
         """
-        raw_target = self._mode_switch_map.get(gesture)
-
         now = time.time()
 
         # Cooldown guard
@@ -243,8 +266,7 @@ class DecisionEngine:
         """Load Smart Mode mappings from gesture_map.json, rejecting unknown actions."""
         data: dict = {}
         try:
-            with open(path, 'r', encoding='utf-8') as fh:
-                data = json.load(fh)
+            data = _read_gesture_map(str(path), path.stat().st_mtime_ns)
             print(f'[DecisionEngine] Loaded gesture map from {path}')
         except FileNotFoundError:
             print(f'[DecisionEngine] gesture_map.json not found — using built-in defaults')
@@ -269,7 +291,9 @@ class DecisionEngine:
 
         self._mode_switch_map = {**defaults['mode_switch'], **validated_switch}
 
-        # Validate per-mode action entries
+        # Validate per-mode action entries, flattened to one (mode, gesture) table.
+        # Keys are interned so the per-frame tuple lookup compares by identity.
+        self._flat_actions = {}
         for mode in MODES:
             raw_mode = data.get(mode, {})
             validated_mode: dict[str, str] = {}
@@ -281,7 +305,9 @@ class DecisionEngine:
                         f'[DecisionEngine] Security: rejected invalid action '
                         f'"{action}" for gesture "{gesture}" in {mode}'
                     )
-            self._action_maps[mode] = {**defaults.get(mode, {}), **validated_mode}
+            for gesture, action in {**defaults.get(mode, {}), **validated_mode}.items():
+                self._flat_actions[(sys.intern(mode), sys.intern(gesture))] = sys.intern(action)
+        self._lookup_action = self._flat_actions.get
 
 
 # ---------------------------------------------------------------------------
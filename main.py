@@ -17,11 +17,12 @@ Usage
   python main.py --headless       # headless OpenCV loop
 """
 
+import os
 import sys
-from pathlib import Path
 
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.abspath(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 
 # ---------------------------------------------------------------------------
@@ -30,15 +31,16 @@ sys.path.insert(0, str(project_root))
 
 def run_headless() -> None:
     """Original OpenCV gesture pipeline (no GUI)."""
+    import time
     import cv2
     from core.camera              import Camera
-    from core.hand_tracking       import HandTracker
-    from core.gesture_classifier  import GestureClassifier
+    from core.hand_tracking       import HandTracker, configure_opencv
     from engine.activation_manager import ActivationManager
     from engine.decision_engine    import DecisionEngine
     from engine.action_executor    import ActionExecutor
     from utils.fps_counter         import FPSCounter
     from utils.config              import Config
+    from utils.logger              import start_console_logger
 
     print('=' * 60)
     print('MMGI  —  Headless OpenCV Mode')
@@ -48,6 +50,9 @@ def run_headless() -> None:
     camera = camera_obj = None
     hand_tracker = None
 
+    # In-loop messages go through a queue so stdout never blocks the loop
+    log, log_listener = start_console_logger()
+
     try:
         camera_obj = Camera(
             width  = config.get('camera.width'),
@@ -56,17 +61,29 @@ def run_headless() -> None:
         )
         if not camera_obj.open():
             print('  ✗ Failed to open camera'); return
+        if config.get('camera.async_capture'):
+            camera_obj.start_async()   # capture overlaps inference
 
+        configure_opencv(config.get('hand_tracking.opencv_threads'))
         hand_tracker       = HandTracker(
             max_num_hands            = config.get('hand_tracking.max_num_hands'),
             min_detection_confidence = config.get('hand_tracking.min_detection_confidence'),
             min_tracking_confidence  = config.get('hand_tracking.min_tracking_confidence'),
+            live_stream              = config.get('hand_tracking.live_stream'),
+            detect_size              = config.get('hand_tracking.detect_size'),
+            use_opencl               = config.get('hand_tracking.use_opencl'),
+            use_gpu                  = config.get('hand_tracking.use_gpu'),
+            model_path               = config.get('hand_tracking.model_path'),
+            detect_every             = config.get('hand_tracking.detect_every'),
+            frame_budget             = 1.0 / max(camera_obj.fps, 1),
         )
-        gesture_classifier = GestureClassifier()
         activation_manager = ActivationManager(
             open_palm_duration   = config.get('activation.open_palm_duration'),
             cooldown_duration    = config.get('activation.cooldown_duration'),
             stability_threshold  = config.get('activation.stability_threshold'),
+            stability_ratio      = config.get('activation.stability_ratio'),
+            leading_frames       = config.get('activation.leading_frames'),
+            adaptive_cooldown    = config.get('activation.adaptive_cooldown'),
         )
         decision_engine    = DecisionEngine()
         action_executor    = ActionExecutor(config={
@@ -81,40 +98,61 @@ def run_headless() -> None:
         cv2.namedWindow(win, cv2.WINDOW_NORMAL)
         cv2.resizeWindow(win, 1280, 720)
 
+        # Drain one queued frame whenever inference overruns a frame period
+        frame_period = 1.0 / max(camera_obj.fps, 1)
+        skip         = 0
+
+        # pollKey (OpenCV ≥ 4.5) pumps HighGUI events without waitKey's 1 ms sleep
+        poll_key = getattr(cv2, 'pollKey', None) or (lambda: cv2.waitKey(1))
+
+        # Display settings are fixed for the session — read them once
+        landmark_outlines = config.get('display.landmark_outlines')
+
+        # Re-check window visibility once a second; skip all drawing while hidden
+        visible, next_visibility_check = True, 0.0
+
         while True:
-            ok, frame = camera_obj.read_frame()
+            ok, frame = camera_obj.read_frame(skip=skip)
             if not ok or frame is None:
                 break
             frame = cv2.flip(frame, 1)
             fps_counter.update()
 
-            results    = hand_tracker.detect_hands(frame)
-            hands_info = hand_tracker.get_hands_info(results)
+            t_detect   = time.perf_counter()
+            if t_detect >= next_visibility_check:
+                visible = cv2.getWindowProperty(win, cv2.WND_PROP_VISIBLE) >= 1
+                activation_manager.render_enabled = visible
+                next_visibility_check = t_detect + 1.0
+
+            results    = hand_tracker.detect_hands(frame, camera_obj.last_frame_time)
+            skip       = int(time.perf_counter() - t_detect > frame_period)
 
-            if results.hand_landmarks:
-                hand_tracker.draw_landmarks(frame, results)
+            if visible and results.hand_landmarks:
+                hand_tracker.draw_landmarks(frame, results, outline=landmark_outlines)
 
-            hand_data = hands_info.get('right') or hands_info.get('left')
+            hand_data = hand_tracker.get_primary_hand(results)
             gesture   = None
             if hand_data:
-                gesture = gesture_classifier.classify(hand_data['finger_states'])
+                gesture = hand_data['gesture']
                 if gesture == 'Unknown':
                     gesture = None
 
             action, mode_changed = decision_engine.process(gesture)
             if mode_changed:
-                print(f'  Mode → {decision_engine.current_mode}')
+                log.info(f'  Mode → {decision_engine.current_mode}')
 
             should_exec = activation_manager.update(gesture)
             if should_exec and action:
                 action_executor.execute(action)
-                print(f'  Action: {action}')
+                log.info(f'  Action: {action}')
 
-            fps_counter.display_fps(frame)
+            if visible:
+                fps_counter.display_fps(frame)
             activation_manager.display_status(frame)
             cv2.imshow(win, frame)
+            activation_manager.flush_events(log.info)
 
-            key = cv2.waitKey(1) & 0xFF
+            key = poll_key() & 0xFF
             if key in (ord('q'), 27):
                 break
 
@@ -126,6 +164,7 @@ def run_headless() -> None:
         if hand_tracker:
             hand_tracker.close()
         cv2.destroyAllWindows()
+        log_listener.stop()
         print('\nMMGI Headless session ended.')
 
 
@@ -78,41 +78,56 @@ class TestActionExecutorExecution(unittest.TestCase):
         self.assertGreaterEqual(self.executor._last_action_time, before)
 
     def test_execute_volume_up_presses_correct_key(self) -> None:
-        with patch('engine.action_executor._PYAUTOGUI', True), \
+        with patch('engine.action_executor._USER32', None), \
+             patch('engine.action_executor._PYAUTOGUI', True), \
              patch('engine.action_executor.pyautogui') as mock_pg:
             self.executor.execute('volume_up')
         mock_pg.press.assert_called_once_with('volumeup')
 
     def test_execute_volume_down_presses_correct_key(self) -> None:
-        with patch('engine.action_executor._PYAUTOGUI', True), \
+        with patch('engine.action_executor._USER32', None), \
+             patch('engine.action_executor._PYAUTOGUI', True), \
              patch('engine.action_executor.pyautogui') as mock_pg:
             self.executor.execute('volume_down')
         mock_pg.press.assert_called_once_with('volumedown')
 
     def test_execute_play_pause_presses_correct_key(self) -> None:
-        with patch('engine.action_executor._PYAUTOGUI', True), \
+        with patch('engine.action_executor._USER32', None), \
+             patch('engine.action_executor._PYAUTOGUI', True), \
              patch('engine.action_executor.pyautogui') as mock_pg:
             self.executor.execute('play_pause')
         mock_pg.press.assert_called_once_with('playpause')
 
     def test_execute_mute_presses_correct_key(self) -> None:
-        with patch('engine.action_executor._PYAUTOGUI', True), \
+        with patch('engine.action_executor._USER32', None), \
+             patch('engine.action_executor._PYAUTOGUI', True), \
              patch('engine.action_executor.pyautogui') as mock_pg:
             self.executor.execute('mute')
         mock_pg.press.assert_called_once_with('volumemute')
 
     def test_execute_next_track_presses_correct_key(self) -> None:
-        with patch('engine.action_executor._PYAUTOGUI', True), \
+        with patch('engine.action_executor._USER32', None), \
+             patch('engine.action_executor._PYAUTOGUI', True), \
              patch('engine.action_executor.pyautogui') as mock_pg:
             self.executor.execute('next_track')
         mock_pg.press.assert_called_once_with('nexttrack')
 
     def test_execute_prev_track_presses_correct_key(self) -> None:
-        with patch('engine.action_executor._PYAUTOGUI', True), \
+        with patch('engine.action_executor._USER32', None), \
+             patch('engine.action_executor._PYAUTOGUI', True), \
              patch('engine.action_executor.pyautogui') as mock_pg:
             self.executor.execute('prev_track')
         mock_pg.press.assert_called_once_with('prevtrack')
 
+    def test_execute_media_key_uses_user32_when_available(self) -> None:
+        mock_user32 = MagicMock()
+        with patch('engine.action_executor._USER32', mock_user32):
+            self.executor.execute('next_track')
+        self.assertEqual(mock_user32.keybd_event.call_count, 2)
+        down, up = mock_user32.keybd_event.call_args_list
+        self.assertEqual(down.args, (0xB0, 0, 0, 0))
+        self.assertEqual(up.args, (0xB0, 0, 2, 0))
+
     def test_unknown_action_does_not_raise(self) -> None:
         """Executing an unrecognised action key must not raise an exception."""
         try:
@@ -121,7 +136,8 @@ class TestActionExecutorExecution(unittest.TestCase):
             self.fail(f'execute() raised {exc!r} for an unknown action key')
 
     def test_execute_sets_last_action_even_for_key_actions(self) -> None:
-        with patch('engine.action_executor._PYAUTOGUI', True), \
+        with patch('engine.action_executor._USER32', None), \
+             patch('engine.action_executor._PYAUTOGUI', True), \
              patch('engine.action_executor.pyautogui'):
             self.executor.execute('mute')
         self.assertEqual(self.executor._last_action, 'mute')
@@ -0,0 +1,124 @@
+"""
+tests/test_activation_manager.py - Unit tests for ActivationManager
+
+Drives the safety gate frame by frame with a patched clock.
+
+Run:
+    python -m pytest tests/test_activation_manager.py -v
+    # or
+    python tests/test_activation_manager.py
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Ensure project root is on the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+from engine.activation_manager import ActivationManager
+
+FRAME = 1 / 30   # seconds per simulated camera frame
+
+
+class _ClockedTest(unittest.TestCase):
+    """Base class: patched time.perf_counter advanced one frame per update."""
+
+    def setUp(self) -> None:
+        patcher = patch('engine.activation_manager.time')
+        self.mock_time = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.now = 1000.0
+        self.mock_time.perf_counter.return_value = self.now
+
+    def feed(self, am: ActivationManager, gesture: str | None, frames: int = 1) -> int:
+        """Feed gesture for the given number of frames; return how many fired."""
+        fired = 0
+        for _ in range(frames):
+            self.now += FRAME
+            self.mock_time.perf_counter.return_value = self.now
+            fired += am.update(gesture)
+        return fired
+
+    def activate(self, am: ActivationManager) -> None:
+        """Hold Open Palm past the activation countdown, then wait out the grace cooldown."""
+        self.feed(am, 'Open Palm', int(2.0 / FRAME) + 2)
+        self.assertTrue(am.is_active)
+        self.feed(am, None, int(am.cooldown / FRAME) + 1)
+
+
+# ---------------------------------------------------------------------------
+# Adaptive cooldown
+# ---------------------------------------------------------------------------
+
+class TestAdaptiveCooldown(_ClockedTest):
+    """Adaptive cooldown learns from separate gestures only."""
+
+    def test_held_gesture_does_not_shrink_cooldown(self) -> None:
+        am = ActivationManager(adaptive_cooldown=True)
+        self.activate(am)
+        fired = self.feed(am, 'One Finger', int(20 / FRAME))
+        self.assertAlmostEqual(am.cooldown, 1.0)
+        self.assertLessEqual(fired, 21)   # one per cooldown, not auto-repeat
+
+    def test_separate_gestures_adapt_cooldown(self) -> None:
+        am = ActivationManager(adaptive_cooldown=True)
+        self.activate(am)
+        for i in range(6):
+            gesture = ('One Finger', 'Two Fingers')[i % 2]
+            self.assertEqual(self.feed(am, gesture, 3), 1)
+            self.feed(am, None, int(1.2 / FRAME))
+        self.assertLess(am.cooldown, 1.0)
+        self.assertGreaterEqual(am.cooldown, ActivationManager._MIN_COOLDOWN)
+
+
+# ---------------------------------------------------------------------------
+# Stability voting + leading edge
+# ---------------------------------------------------------------------------
+
+class TestStabilityVoting(_ClockedTest):
+    """Defaults: 9 of the last 11 frames, or 3 in a row for a new gesture."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.am = ActivationManager()
+        self.activate(self.am)
+
+    def test_new_gesture_fires_after_leading_frames(self) -> None:
+        self.assertEqual(self.feed(self.am, 'One Finger', 2), 0)
+        self.assertEqual(self.feed(self.am, 'One Finger', 1), 1)
+
+    def test_repeat_needs_full_vote(self) -> None:
+        self.assertEqual(self.feed(self.am, 'One Finger', 3), 1)
+        self.feed(self.am, None, int(1.2 / FRAME))           # release, cooldown over
+        self.assertEqual(self.feed(self.am, 'One Finger', 8), 0)
+        self.assertEqual(self.feed(self.am, 'One Finger', 1), 1)
+
+    def test_flicker_frame_does_not_reset_stability(self) -> None:
+        self.assertEqual(self.feed(self.am, 'One Finger', 3), 1)
+        self.feed(self.am, None, int(1.2 / FRAME))
+        self.assertEqual(self.feed(self.am, 'One Finger', 5), 0)
+        self.assertEqual(self.feed(self.am, None, 1), 0)      # one dropped frame
+        self.assertEqual(self.feed(self.am, 'One Finger', 3), 0)
+        # 9 of the last 11 frames — fires without 10 fresh consecutive frames
+        self.assertEqual(self.feed(self.am, 'One Finger', 1), 1)
+
+    def test_cooldown_gates_firing(self) -> None:
+        self.assertEqual(self.feed(self.am, 'One Finger', 3), 1)
+        self.assertEqual(self.feed(self.am, 'Two Fingers', 3), 0)
+        self.assertTrue(self.am.is_in_cooldown)
+        self.assertEqual(self.feed(self.am, 'Two Fingers', int(1.0 / FRAME)), 1)
+
+    def test_deactivation_gates_firing(self) -> None:
+        self.feed(self.am, 'Fist')
+        self.assertFalse(self.am.is_active)
+        self.assertEqual(self.feed(self.am, 'One Finger', 30), 0)
+
+    def test_inactive_never_fires(self) -> None:
+        am = ActivationManager()
+        self.assertEqual(self.feed(am, 'One Finger', 30), 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
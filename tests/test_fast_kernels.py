@@ -0,0 +1,51 @@
+"""
+tests/test_fast_kernels.py - Unit tests for the core/_fast landmark kernels
+
+Checks that the (optionally Numba-compiled) kernels agree with their
+pure-NumPy fallbacks, so both code paths classify hands identically.
+
+Run:
+    python -m pytest tests/test_fast_kernels.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Ensure project root is on the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unittest
+
+import numpy as np
+
+from core import _fast
+from core.gesture_classifier import GESTURE_ID_BY_MASK, GESTURE_NAMES, classify_gesture
+
+
+class TestFastKernels(unittest.TestCase):
+    """Compiled kernels vs. reference implementations."""
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.hands = rng.random((200, 21, 3), dtype=np.float32)
+
+    def test_finger_mask_matches_fallback(self) -> None:
+        for lm in self.hands:
+            self.assertEqual(int(_fast.finger_mask(lm)), _fast._finger_mask_py(lm))
+
+    def test_mask_and_gesture_matches_classifier(self) -> None:
+        for lm in self.hands:
+            mask, gesture_id = _fast.mask_and_gesture(lm, GESTURE_ID_BY_MASK)
+            fingers = [int(mask) >> i & 1 for i in range(5)]
+            self.assertEqual(GESTURE_NAMES[gesture_id], classify_gesture(fingers))
+
+    def test_project_landmarks_matches_fallback(self) -> None:
+        for lm in self.hands[:20]:
+            np.testing.assert_array_equal(
+                _fast.project_landmarks(lm, 1280, 720),
+                _fast._project_landmarks_py(lm, 1280, 720),
+            )
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
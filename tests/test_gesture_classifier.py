@@ -83,6 +83,14 @@ class TestGestureClassifier(unittest.TestCase):
         states = {'index': True, 'middle': True, 'ring': True, 'pinky': False}
         self.assertEqual(self.clf.classify(states), 'Three Fingers')
 
+    def test_bitmask_input(self) -> None:
+        # bit 0 = thumb … bit 4 = pinky
+        self.assertEqual(self.clf.classify(0b00000), 'Fist')
+        self.assertEqual(self.clf.classify(0b11111), 'Open Palm')
+        self.assertEqual(self.clf.classify(0b00001), 'Thumbs Up')
+        self.assertEqual(self.clf.classify(0b00110), 'Two Fingers')
+        self.assertEqual(self.clf.classify(0b11000), 'Ring and Pinky')
+
     # ------------------------------------------------------------------
     # Consistency
     # ------------------------------------------------------------------
@@ -105,6 +113,15 @@ class TestGestureClassifier(unittest.TestCase):
                 result = self.clf.classify(states)
                 self.assertEqual(result, name, f'Expected {name}, got {result} for states {states}')
 
+    def test_lookup_table_matches_pattern_scan(self) -> None:
+        """The precomputed 32-entry table must agree with the ordered pattern scan."""
+        fingers = ('thumb', 'index', 'middle', 'ring', 'pinky')
+        for mask in range(32):
+            states = {f: bool(mask >> i & 1) for i, f in enumerate(fingers)}
+            with self.subTest(mask=mask):
+                self.assertEqual(self.clf.classify(states), self.clf._match(states))
+                self.assertEqual(self.clf.classify_mask(mask), self.clf._match(states))
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -0,0 +1,73 @@
+"""
+tests/test_worker_thread.py - Unit tests for the dashboard WorkerThread
+
+Checks the cross-thread hand-off between the pipeline thread and the GUI
+thread's SharedState (runs headless via the offscreen Qt platform).
+
+Run:
+    python -m pytest tests/test_worker_thread.py -v
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Ensure project root is on the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import unittest
+
+from PyQt6.QtCore import QCoreApplication, QObject, pyqtSlot
+from PyQt6.QtGui  import QImage
+
+from ui.shared_state  import FrameTelemetry, SharedState
+from ui.worker_thread import WorkerThread
+
+
+class _QueuedFrameWorker(WorkerThread):
+    """Worker whose pipeline emits a single active frame and exits."""
+
+    def run(self) -> None:
+        self.frame_ready.emit(QImage(4, 4, QImage.Format.Format_BGR888), FrameTelemetry(
+            gesture='One Finger', confidence=1.0, fps=30.0, latency_ms=10.0,
+            mode_stability=0.0, system_active=True, in_cooldown=False,
+        ))
+
+
+class _FrameSink(QObject):
+    """GUI-thread receiver standing in for MainWindow._on_frame."""
+
+    def __init__(self, state: SharedState) -> None:
+        super().__init__()
+        self._state = state
+
+    @pyqtSlot(QImage, object)
+    def on_frame(self, image: QImage, telemetry) -> None:
+        self._state.apply_frame(telemetry)
+
+
+class TestWorkerShutdown(unittest.TestCase):
+    """The final system_active=False must land after any queued frame."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def test_queued_frame_does_not_reactivate_after_stop(self) -> None:
+        state  = SharedState()
+        sink   = _FrameSink(state)
+        worker = _QueuedFrameWorker(state)
+        worker.frame_ready.connect(sink.on_frame)
+
+        worker.start()
+        self.assertTrue(worker.wait(5000))
+        self.assertFalse(state.system_active)   # frame still queued, not applied
+
+        self.app.processEvents()                # deliver frame, then finished
+        self.assertFalse(state.system_active)
+        self.assertEqual(state.current_gesture, 'One Finger')   # frame was applied
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -21,9 +21,28 @@ state.set_system_active(True)
 
 from __future__ import annotations
 
+import time
+from typing import NamedTuple
+
 from PyQt6.QtCore import QObject, pyqtSignal
 
 
+# Continuous telemetry (fps, latency) changes every frame; the dashboard
+# cannot show it faster than this, so emissions are throttled to it.
+TELEMETRY_HZ = 15
+
+
+class FrameTelemetry(NamedTuple):
+    """Per-frame pipeline values, delivered in one batch with each video frame."""
+    gesture:        str
+    confidence:     float
+    fps:            float
+    latency_ms:     float
+    mode_stability: float
+    system_active:  bool
+    in_cooldown:    bool
+
+
 class SharedState(QObject):
     """
     Central reactive data store.
@@ -75,6 +94,15 @@ class SharedState(QObject):
         self._mode_stability   = 0.0
         self._last_action      = ''
 
+        # Last fps / latency value emitted and when (see TELEMETRY_HZ).  Values
+        # are compared against what was emitted, not what was stored, so one
+        # throttled away is still sent once the window reopens.
+        self._telemetry_interval = 1.0 / TELEMETRY_HZ
+        self._fps_emitted        = self._fps
+        self._fps_emitted_at     = 0.0
+        self._latency_emitted    = self._latency_ms
+        self._latency_emitted_at = 0.0
+
     # ------------------------------------------------------------------ getters
     @property
     def system_active(self)   -> bool:  return self._system_active
@@ -114,16 +142,28 @@ class SharedState(QObject):
             self.gesture_changed.emit(value)
 
     def set_confidence(self, value: float) -> None:
-        self._confidence = round(value, 3)
-        self.confidence_changed.emit(self._confidence)
+        value = round(value, 3)
+        if self._confidence != value:
+            self._confidence = value
+            self.confidence_changed.emit(value)
 
     def set_fps(self, value: float) -> None:
-        self._fps = round(value, 1)
-        self.fps_changed.emit(self._fps)
+        self._fps = value = round(value, 1)
+        if self._fps_emitted == value:
+            return
+        now = time.monotonic()
+        if now - self._fps_emitted_at >= self._telemetry_interval:
+            self._fps_emitted, self._fps_emitted_at = value, now
+            self.fps_changed.emit(value)
 
     def set_latency(self, value: float) -> None:
-        self._latency_ms = round(value, 1)
-        self.latency_changed.emit(self._latency_ms)
+        self._latency_ms = value = round(value, 1)
+        if self._latency_emitted == value:
+            return
+        now = time.monotonic()
+        if now - self._latency_emitted_at >= self._telemetry_interval:
+            self._latency_emitted, self._latency_emitted_at = value, now
+            self.latency_changed.emit(value)
 
     def set_cooldown(self, value: bool) -> None:
         if self._in_cooldown != value:
@@ -137,14 +177,26 @@ class SharedState(QObject):
             self.volume_changed.emit(clamped)
 
     def set_mode_stability(self, value: float) -> None:
-        self._mode_stability = round(max(0.0, min(1.0, value)), 3)
-        self.mode_stability_changed.emit(self._mode_stability)
+        value = round(max(0.0, min(1.0, value)), 3)
+        if self._mode_stability != value:
+            self._mode_stability = value
+            self.mode_stability_changed.emit(value)
 
     def set_action_executed(self, action: str) -> None:
         """Record the most recently executed action and broadcast it."""
         self._last_action = action
         self.action_executed.emit(action)
 
+    def apply_frame(self, t: FrameTelemetry) -> None:
+        """Apply one frame's telemetry; each setter still emits only on change."""
+        self.set_gesture(t.gesture)
+        self.set_confidence(t.confidence)
+        self.set_fps(t.fps)
+        self.set_latency(t.latency_ms)
+        self.set_mode_stability(t.mode_stability)
+        self.set_system_active(t.system_active)
+        self.set_cooldown(t.in_cooldown)
+
     def emit_log(self, timestamp: str, category: str, description: str) -> None:
         """Convenience wrapper to push an activity log event."""
         self.log_event.emit(timestamp, category, description)
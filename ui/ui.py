@@ -22,6 +22,8 @@ Entry point:
 from __future__ import annotations
 
 import json
+from bisect import bisect_right
+from collections import deque
 from pathlib import Path
 
 # ===========================================================================
@@ -103,8 +105,10 @@ QToolTip {{
 # Imports for widgets
 # ===========================================================================
 
-from PyQt6.QtCore    import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal, QSize, pyqtSlot, QTimer
-from PyQt6.QtGui     import QIcon, QFont, QImage, QPixmap, QCloseEvent
+from PyQt6.QtCore    import Qt, QEvent, QPropertyAnimation, QEasingCurve, pyqtSignal, QSize, pyqtSlot, QTimer, QRect, QRectF
+from PyQt6.QtGui     import (
+    QIcon, QFont, QFontMetrics, QImage, QPixmap, QCloseEvent, QPainter, QColor, QPen,
+)
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
     QPushButton, QFrame, QProgressBar, QScrollArea,
@@ -165,35 +169,122 @@ def _pill_colour(category: str) -> tuple[str, str]:
     return _CATEGORY_STYLE.get(category.upper(), _DEFAULT_STYLE)
 
 
-class EventPill(QFrame):
-    def __init__(self, timestamp: str, category: str, description: str) -> None:
-        super().__init__()
-        colour, bg = _pill_colour(category)
-        self.setFixedHeight(42)
-        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        self.setStyleSheet(
-            f'QFrame {{ background-color: {bg}; border: 1px solid {colour}33; border-radius: 21px; }}'
-        )
-        lay = QHBoxLayout(self)
-        lay.setContentsMargins(14, 0, 14, 0)
-        lay.setSpacing(8)
+_PILL_H       = 42
+_PILL_PAD     = 14     # horizontal padding inside a pill
+_PILL_GAP     = 8      # gap between pills and between a pill's segments
 
-        dot = QLabel('●')
-        dot.setStyleSheet(f'color: {colour}; font-size: 10px; background: transparent; border: none;')
-        ts_lbl = QLabel(timestamp)
-        ts_lbl.setStyleSheet(f'color: {TEXT_HINT}; font-size: 11px; background: transparent; border: none;')
-        cat_lbl = QLabel(category.upper())
-        cat_lbl.setStyleSheet(
-            f'color: {colour}; font-size: 10px; font-weight: 700; letter-spacing: 1px; background: transparent; border: none;'
-        )
-        desc_lbl = QLabel(description)
-        desc_lbl.setStyleSheet(f'color: {TEXT_PRI}; font-size: 12px; background: transparent; border: none;')
 
-        lay.addWidget(dot)
-        lay.addWidget(ts_lbl)
-        lay.addWidget(cat_lbl)
-        lay.addWidget(desc_lbl)
-        self.adjustSize()
+class EventPill:
+    """
+    One activity-log entry, laid out once when it arrives.
+
+    Holds the pill's colours, its x-offset on the strip and the x-position of
+    each text segment, so painting is just a rounded rect and four drawText
+    calls — no per-event widgets.
+    """
+
+    __slots__ = ('x', 'width', 'colour', 'segments')
+
+    def __init__(self, x: int, width: int, colour: str,
+                 segments: tuple[tuple[int, int, str], ...]) -> None:
+        self.x        = x          # absolute offset (see _PillStrip._origin)
+        self.width    = width
+        self.colour   = colour
+        self.segments = segments   # (font index, x within pill, text)
+
+
+class _PillStrip(QWidget):
+    """
+    Horizontal strip that paints activity pills directly.
+
+    Only the pills intersecting the exposed rect are drawn, so the cost of
+    a new event is one layout pass over its own text plus a repaint of the
+    visible strip, however many events are retained.
+    """
+
+    # Segment fonts: (pixel size, bold, letter spacing)
+    _FONT_SPECS = ((10, False, 0), (11, False, 0), (10, True, 1), (12, False, 0))
+    _TEXT_COLOURS = (None, TEXT_HINT, None, TEXT_PRI)   # None → category colour
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._pills:   deque[EventPill] = deque(maxlen=MAX_EVENTS)
+        self._offsets: deque[int]       = deque(maxlen=MAX_EVENTS)   # pill.x, ascending
+        self._origin   = 0                    # absolute x of the strip's left edge
+        self._end      = 0                    # absolute x after the last pill
+        self._fonts:   list[QFont] = []
+        self._metrics: list[QFontMetrics] = []
+        self.setFixedHeight(_PILL_H)
+
+    def _ensure_fonts(self) -> None:
+        if self._fonts:
+            return
+        self.ensurePolished()
+        for px, bold, spacing in self._FONT_SPECS:
+            font = QFont(self.font())
+            font.setPixelSize(px)
+            font.setBold(bold)
+            if spacing:
+                font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, spacing)
+            self._fonts.append(font)
+            self._metrics.append(QFontMetrics(font))
+
+    def add(self, timestamp: str, category: str, description: str) -> None:
+        """Append a pill, evicting the oldest beyond MAX_EVENTS."""
+        self._ensure_fonts()
+        colour, _ = _pill_colour(category)
+        texts = ('●', timestamp, category.upper(), description)
+
+        segments = []
+        x = _PILL_PAD
+        for i, text in enumerate(texts):
+            segments.append((i, x, text))
+            x += self._metrics[i].horizontalAdvance(text) + _PILL_GAP
+        width = x - _PILL_GAP + _PILL_PAD
+
+        start = self._end + (_PILL_GAP if self._pills else 0)
+        # Bounded deques: appending past MAX_EVENTS drops the oldest pill
+        self._pills.append(EventPill(start, width, colour, tuple(segments)))
+        self._offsets.append(start)
+        self._origin = self._offsets[0]
+        self._end    = start + width
+
+        self.resize(self.sizeHint())
+        self.update()
+
+    def sizeHint(self) -> QSize:
+        return QSize(self._end - self._origin, _PILL_H)
+
+    def paintEvent(self, event) -> None:
+        if not self._pills:
+            return
+        rect  = event.rect()
+        left  = rect.left() + self._origin
+        right = rect.right() + self._origin
+        # Pills are ordered by x: start one early in case it overlaps `left`
+        first = max(bisect_right(self._offsets, left) - 1, 0)
+        last  = bisect_right(self._offsets, right)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        for i in range(first, last):
+            pill = self._pills[i]
+            x = pill.x - self._origin
+            fill = QColor(pill.colour)
+            fill.setAlphaF(0.12)
+            edge = QColor(pill.colour)
+            edge.setAlpha(0x33)
+            painter.setPen(QPen(edge, 1))
+            painter.setBrush(fill)
+            painter.drawRoundedRect(QRectF(x + 0.5, 0.5, pill.width - 1, _PILL_H - 1),
+                                    _PILL_H / 2, _PILL_H / 2)
+            for font_idx, sx, text in pill.segments:
+                painter.setFont(self._fonts[font_idx])
+                painter.setPen(QColor(self._TEXT_COLOURS[font_idx] or pill.colour))
+                painter.drawText(QRect(x + sx, 0, pill.width, _PILL_H),
+                                 Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                                 text)
+        painter.end()
 
 
 class ActivityLog(QWidget):
@@ -201,7 +292,6 @@ class ActivityLog(QWidget):
         super().__init__(parent)
         self._state  = state
         self._count  = 0
-        self._pills: list[EventPill] = []
         self._build()
         state.log_event.connect(self._on_log_event)
 
@@ -228,30 +318,18 @@ class ActivityLog(QWidget):
         self._scroll = QScrollArea()
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self._scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self._scroll.setWidgetResizable(True)
+        self._scroll.setWidgetResizable(False)
         self._scroll.setStyleSheet('QScrollArea { background: transparent; border: none; }')
 
-        self._inner = QWidget()
-        self._inner.setStyleSheet('background: transparent;')
-        self._pills_lay = QHBoxLayout(self._inner)
-        self._pills_lay.setContentsMargins(0, 0, 0, 0)
-        self._pills_lay.setSpacing(8)
-        self._pills_lay.addStretch()
+        self._strip = _PillStrip()
+        self._strip.setStyleSheet('background: transparent; border: none;')
 
-        self._scroll.setWidget(self._inner)
+        self._scroll.setWidget(self._strip)
         outer.addWidget(self._scroll)
 
     @pyqtSlot(str, str, str)
     def _on_log_event(self, timestamp: str, category: str, description: str) -> None:
-        if len(self._pills) >= MAX_EVENTS:
-            old = self._pills.pop(0)
-            self._pills_lay.removeWidget(old)
-            old.deleteLater()
-
-        pill = EventPill(timestamp, category, description)
-        insert_idx = self._pills_lay.count() - 1
-        self._pills_lay.insertWidget(insert_idx, pill)
-        self._pills.append(pill)
+        self._strip.add(timestamp, category, description)
 
         self._count += 1
         self._count_lbl.setText(f'{self._count} event{"s" if self._count != 1 else ""}')
@@ -409,6 +487,9 @@ _MODE_ACCENT = {
 
 
 class VisionPanel(QWidget):
+    # Video area size (w, h) whenever the video label is resized
+    preview_resized = pyqtSignal(int, int)
+
     def __init__(self, state: SharedState, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._state = state
@@ -435,6 +516,7 @@ class VisionPanel(QWidget):
         self._video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._video_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self._video_label.setMinimumSize(480, 270)
+        self._video_label.installEventFilter(self)
         self._video_label.setText('⬤  Waiting for camera…')
         self._video_label.setStyleSheet(f'color: {TEXT_HINT}; font-size: 16px; background: transparent; border: none;')
         cam_lay.addWidget(self._video_label)
@@ -545,6 +627,17 @@ class VisionPanel(QWidget):
         s.system_active_changed.connect(self._on_active_changed)
         s.action_executed.connect(self._on_action_executed)
 
+    @property
+    def preview_size(self) -> tuple[int, int]:
+        return self._video_label.width(), self._video_label.height()
+
+    def eventFilter(self, obj, event) -> bool:
+        # Watch the label itself: the panel's own resizeEvent runs before
+        # its layout has given the label its new geometry
+        if obj is self._video_label and event.type() == QEvent.Type.Resize:
+            self.preview_resized.emit(*self.preview_size)
+        return super().eventFilter(obj, event)
+
     @pyqtSlot(QImage)
     def update_frame(self, image: QImage) -> None:
         lbl_w = self._video_label.width()
@@ -634,6 +727,21 @@ _SWITCH_INSTRUCTIONS = [
 ]
 
 
+def _active_label_qss(rules: str) -> str:
+    """Label stylesheet coloured INACTIVE / ACTIVE by the label's `active` property."""
+    return f'QLabel {{ color: {INACTIVE}; {rules} }} QLabel[active="true"] {{ color: {ACTIVE}; }}'
+
+
+def _set_active_property(widget: QWidget, active: bool) -> None:
+    """Flip widget's `active` property and re-polish it, only when it changes."""
+    if widget.property('active') == active:
+        return
+    widget.setProperty('active', active)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
 def _divider() -> QFrame:
     line = QFrame()
     line.setFrameShape(QFrame.Shape.HLine)
@@ -700,10 +808,12 @@ class SystemCard(QFrame):
 
         badge_row = QHBoxLayout()
         self._dot = QLabel('●')
-        self._dot.setStyleSheet(f'color: {INACTIVE}; font-size: 16px; background: transparent; border: none;')
+        self._dot.setProperty('active', False)
+        self._dot.setStyleSheet(_active_label_qss('font-size: 16px; background: transparent; border: none;'))
         self._status_lbl = QLabel('INACTIVE')
+        self._status_lbl.setProperty('active', False)
         self._status_lbl.setStyleSheet(
-            f'color: {INACTIVE}; font-size: 13px; font-weight: 600; background: transparent; border: none;'
+            _active_label_qss('font-size: 13px; font-weight: 600; background: transparent; border: none;')
         )
         badge_row.addWidget(self._dot)
         badge_row.addWidget(self._status_lbl)
@@ -715,7 +825,7 @@ class SystemCard(QFrame):
         self._toggle_btn.setFixedHeight(40)
         self._toggle_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self._toggle_btn.setProperty('active', False)
-        self._toggle_btn.setStyleSheet(self._btn_style(False))
+        self._toggle_btn.setStyleSheet(self._btn_style())
         self._toggle_btn.clicked.connect(self._on_toggle_clicked)
         lay.addWidget(self._toggle_btn)
 
@@ -727,30 +837,23 @@ class SystemCard(QFrame):
 
     @pyqtSlot(bool)
     def _on_active(self, active: bool) -> None:
-        if active:
-            self._dot.setStyleSheet(f'color: {ACTIVE}; font-size: 16px; background: transparent; border: none;')
-            self._status_lbl.setText('ACTIVE')
-            self._status_lbl.setStyleSheet(f'color: {ACTIVE}; font-size: 13px; font-weight: 600; background: transparent; border: none;')
-            self._toggle_btn.setText('SYSTEM  ON')
-            self._toggle_btn.setStyleSheet(self._btn_style(True))
-        else:
-            self._dot.setStyleSheet(f'color: {INACTIVE}; font-size: 16px; background: transparent; border: none;')
-            self._status_lbl.setText('INACTIVE')
-            self._status_lbl.setStyleSheet(f'color: {INACTIVE}; font-size: 13px; font-weight: 600; background: transparent; border: none;')
-            self._toggle_btn.setText('SYSTEM  OFF')
-            self._toggle_btn.setStyleSheet(self._btn_style(False))
+        self._status_lbl.setText('ACTIVE' if active else 'INACTIVE')
+        self._toggle_btn.setText('SYSTEM  ON' if active else 'SYSTEM  OFF')
+        for widget in (self._dot, self._status_lbl, self._toggle_btn):
+            _set_active_property(widget, active)
 
     def _on_toggle_clicked(self) -> None:
         pass  # Visual feedback only
 
     @staticmethod
-    def _btn_style(active: bool) -> str:
-        bg  = ACTIVE   if active else INACTIVE
-        hov = '#33ffaa' if active else '#ff6680'
+    def _btn_style() -> str:
+        """Both toggle states; _on_active switches between them via the `active` property."""
         return (
-            f'QPushButton {{ background-color: {bg}; color: #0F0F14; border: none; border-radius: 20px; '
+            f'QPushButton {{ background-color: {INACTIVE}; color: #0F0F14; border: none; border-radius: 20px; '
             f'padding: 8px 24px; font-size: 13px; font-weight: 700; letter-spacing: 1px; }}'
-            f'QPushButton:hover {{ background-color: {hov}; }}'
+            f'QPushButton:hover {{ background-color: #ff6680; }}'
+            f'QPushButton[active="true"] {{ background-color: {ACTIVE}; }}'
+            f'QPushButton[active="true"]:hover {{ background-color: #33ffaa; }}'
         )
 
 
@@ -1375,7 +1478,8 @@ class MainWindow(QMainWindow):
         subtitle.setStyleSheet(f'color: {TEXT_HINT}; font-size: 12px;')
 
         self._header_status = QLabel('⬤  INACTIVE')
-        self._header_status.setStyleSheet(f'color: {INACTIVE}; font-size: 12px; font-weight: 600;')
+        self._header_status.setProperty('active', False)
+        self._header_status.setStyleSheet(_active_label_qss('font-size: 12px; font-weight: 600;'))
 
         self._header_mode = QLabel('APP MODE')
         self._header_mode.setStyleSheet(
@@ -1396,18 +1500,23 @@ class MainWindow(QMainWindow):
 
     def _start_worker(self) -> None:
         self._worker = WorkerThread(self._state, parent=self)
-        self._worker.frame_ready.connect(self._vision.update_frame)
+        self._worker.frame_ready.connect(self._on_frame)
+        # Until the panel's first resize the worker emits full frames; the
+        # label's pre-layout size would make it downscale far too much
+        self._vision.preview_resized.connect(self._worker.set_preview_size)
         self._worker.error.connect(self._on_worker_error)
         self._worker.start()
 
+    @pyqtSlot(QImage, object)
+    def _on_frame(self, image: QImage, telemetry) -> None:
+        """Fan one worker frame out: telemetry to SharedState, image to the Vision Panel."""
+        self._state.apply_frame(telemetry)
+        self._vision.update_frame(image)
+
     @pyqtSlot(bool)
     def _on_active_header(self, active: bool) -> None:
-        if active:
-            self._header_status.setText('⬤  ACTIVE')
-            self._header_status.setStyleSheet(f'color: {ACTIVE}; font-size: 12px; font-weight: 600;')
-        else:
-            self._header_status.setText('⬤  INACTIVE')
-            self._header_status.setStyleSheet(f'color: {INACTIVE}; font-size: 12px; font-weight: 600;')
+        self._header_status.setText('⬤  ACTIVE' if active else '⬤  INACTIVE')
+        _set_active_property(self._header_status, active)
 
     @pyqtSlot(str)
     def _on_mode_header(self, mode: str) -> None:
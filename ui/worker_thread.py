@@ -13,31 +13,33 @@ pushes state updates into SharedState so the UI never blocks.
 Pipeline per frame
 ------------------
 1. Camera.read_frame()
-2. HandTracker.process_frame()
-3. GestureClassifier.classify()
+2. HandTracker.detect_hands() + get_primary_hand()
+3. Gesture lookup (fused with finger-state packing in get_primary_hand)
 4. DecisionEngine.process()  ← Smart Mode (mode-switch OR action)
 5. ActivationManager.update()
 6. ActionExecutor.execute()   (only when active + action resolved)
-7. Update SharedState + emit frame as QImage
+7. Emit frame (downscaled to the preview) as QImage + FrameTelemetry
 
 Signals emitted to the outside
 -------------------------------
-frame_ready(QImage)  – annotated video frame for the Vision Panel
+frame_ready(QImage, FrameTelemetry) – annotated video frame for the Vision
+                                     Panel plus that frame's telemetry,
+                                     batched into one queued event
 error(str)           – fatal pipeline error message
 """
 
 from __future__ import annotations
 
 import time
-from datetime import datetime
+from functools import lru_cache
 
 import cv2
+import numpy as np
 from PyQt6.QtCore  import QThread, pyqtSignal
 from PyQt6.QtGui   import QImage
 
 from core.camera                 import Camera
-from core.hand_tracking          import HandTracker
-from core.gesture_classifier     import GestureClassifier
+from core.hand_tracking          import HandTracker, configure_opencv
 from core.system_mode_engine     import AirMouseController
 from engine.activation_manager   import ActivationManager
 from engine.decision_engine      import DecisionEngine
@@ -45,7 +47,8 @@ from engine.action_executor      import ActionExecutor
 from utils.fps_counter           import FPSCounter
 from utils.config                import Config
 from utils.logger                import get_performance_logger
-from ui.shared_state             import SharedState
+from utils.overlay               import Sprite, text_sprite
+from ui.shared_state             import FrameTelemetry, SharedState
 
 
 # ---------------------------------------------------------------------------
@@ -64,47 +67,73 @@ _MODE_COLOURS = {
     'System Mode': (120, 100, 255),  # violet
 }
 
-def _ts() -> str:
-    return datetime.now().strftime('%H:%M:%S')
+@lru_cache(maxsize=16)
+def _top_bar_layer(w: int, mode: str, is_active: bool) -> Sprite:
+    """
+    Pre-composed top-bar layer: 70 % dark tint under the state dot, state
+    text and mode label.  Rebuilt only when width, mode or state change.
+    """
+    layer = Sprite(w, 61)
+    cover = np.zeros((61, w), dtype=np.uint8)
+
+    state_color = _GREEN if is_active else _RED
+    state_text  = 'ACTIVE' if is_active else 'INACTIVE'
+    mc = _MODE_COLOURS.get(mode, _ACCENT)
+    for canvas, c_state, c_mode in ((layer.image, state_color, mc), (cover, 255, 255)):
+        cv2.circle(canvas, (24, 30), 8, c_state, -1)
+        cv2.putText(canvas, state_text, (38, 36),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, c_state, 2)
+        cv2.putText(canvas, mode.upper(), (w // 2 - 70, 36),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.65, c_mode, 2)
+    layer.set_layers(cover, _DARK, 0.7)
+    return layer
+
+
+@lru_cache(maxsize=32)
+def _gesture_layer(gesture: str) -> tuple[Sprite, int]:
+    """Gesture-label layer and the offset of its baseline from the top."""
+    (tw, th), baseline = cv2.getTextSize(gesture, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)
+    top   = th + 2
+    layer = Sprite(tw + 4, top + baseline + 2)
+    cover = np.zeros((layer.height, layer.width), dtype=np.uint8)
+    cv2.putText(layer.image, gesture, (0, top), cv2.FONT_HERSHEY_SIMPLEX, 0.8, _ACCENT, 2)
+    cv2.putText(cover, gesture, (0, top), cv2.FONT_HERSHEY_SIMPLEX, 0.8, 255, 2)
+    layer.set_alpha_from_mask(cover)
+    return layer, top
 
 
 def _draw_overlay(frame, gesture: str | None, mode: str,
                   is_active: bool, fps: float) -> None:
-    """Annotate frame in-place with gesture/mode/state HUD."""
-    h, w = frame.shape[:2]
-
-    # Semi-transparent top bar
-    overlay = frame.copy()
-    cv2.rectangle(overlay, (0, 0), (w, 60), _DARK, -1)
-    cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+    """
+    Annotate frame in-place with gesture/mode/state HUD.
 
-    # State indicator
-    state_color = _GREEN if is_active else _RED
-    state_text  = 'ACTIVE' if is_active else 'INACTIVE'
-    cv2.circle(frame, (24, 30), 8, state_color, -1)
-    cv2.putText(frame, state_text, (38, 36),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.6, state_color, 2)
+    Every element is a cached layer composited over its own ROI, so no
+    text is rasterised and no full-frame pass is made per frame.
+    """
+    h, w = frame.shape[:2]
 
-    # Mode
-    mc = _MODE_COLOURS.get(mode, _ACCENT)
-    cv2.putText(frame, mode.upper(), (w // 2 - 70, 36),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.65, mc, 2)
+    # Top bar: tint + state + mode in a single blend
+    _top_bar_layer(w, mode, is_active).blit(frame, 0, 0)
 
     # FPS
-    cv2.putText(frame, f'FPS {fps:.0f}', (w - 90, 36),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.55, _WHITE, 1)
+    layer, dx, dy = text_sprite(f'FPS {fps:.0f}', 0.55, _WHITE)
+    layer.blit(frame, w - 90 + dx, 36 + dy)
 
     # Gesture label
     if gesture:
-        cv2.putText(frame, gesture, (16, h - 20),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, _ACCENT, 2)
+        layer, top = _gesture_layer(gesture)
+        layer.blit(frame, 16, h - 20 - top)
 
 
 def _frame_to_qimage(frame) -> QImage:
-    """Convert a BGR numpy frame to QImage (RGB888)."""
-    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    h, w, ch = rgb.shape
-    return QImage(rgb.data, w, h, ch * w, QImage.Format.Format_RGB888).copy()
+    """
+    Wrap a BGR numpy frame as a QImage (BGR888).
+
+    Qt reads BGR directly, so the only per-frame work is the single deep
+    copy that detaches the image from the worker's frame buffer.
+    """
+    h, w, ch = frame.shape
+    return QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_BGR888).copy()
 
 
 # ---------------------------------------------------------------------------
@@ -114,7 +143,7 @@ def _frame_to_qimage(frame) -> QImage:
 class WorkerThread(QThread):
     """Background pipeline thread."""
 
-    frame_ready = pyqtSignal(QImage)
+    frame_ready = pyqtSignal(QImage, object)   # (frame, FrameTelemetry)
     error       = pyqtSignal(str)
 
     def __init__(self, state: SharedState, parent=None) -> None:
@@ -126,6 +155,21 @@ class WorkerThread(QThread):
         self._config:    Config | None = None
         self._camera:    Camera | None = None
 
+        # Vision Panel display box (w, h); frames are shrunk to fit it here
+        # so the GUI thread never rescales a full camera frame
+        self._preview_size: tuple[int, int] | None = None
+        self._preview_buf:  np.ndarray | None      = None
+
+        # 'HH:MM:' prefix for _ts(), re-formatted only when the minute rolls over
+        self._ts_minute = -1
+        self._ts_prefix = ''
+
+        # Frame telemetry (incl. system_active) reaches SharedState through
+        # queued frame_ready events, so the shutdown reset must be queued
+        # behind them too: finished is emitted from the worker thread and
+        # delivered to _on_finished on the GUI thread after the last frame.
+        self.finished.connect(self._on_finished)
+
     # ------------------------------------------------------------------
     # Public control
     # ------------------------------------------------------------------
@@ -134,6 +178,42 @@ class WorkerThread(QThread):
         """Request the pipeline to stop."""
         self._running = False
 
+    def _on_finished(self) -> None:
+        """GUI thread: the pipeline has stopped, whatever frames were still queued."""
+        self._state.set_system_active(False)
+
+    def _ts(self) -> str:
+        """Wall-clock HH:MM:SS for activity-log entries."""
+        now = int(time.time())
+        if now // 60 != self._ts_minute:
+            self._ts_minute = now // 60
+            self._ts_prefix = time.strftime('%H:%M:', time.localtime(now))
+        return f'{self._ts_prefix}{now % 60:02d}'
+
+    def set_preview_size(self, width: int, height: int) -> None:
+        """Set the box emitted frames are downscaled to fit (called from the GUI thread)."""
+        self._preview_size = (width, height)
+
+    def _preview_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Return frame shrunk (INTER_AREA) to fit the preview box, or frame if it fits."""
+        if self._preview_size is None:
+            return frame
+        box_w, box_h = self._preview_size
+        h, w = frame.shape[:2]
+        if box_w >= w and box_h >= h:
+            return frame
+        # Same rounding as QSize.scaled(KeepAspectRatio), so the panel's own
+        # scaled() call sees a matching size and returns without resampling
+        tw, th = box_h * w // h, box_h
+        if tw > box_w:
+            tw, th = box_w, box_w * h // w
+        if tw < 1 or th < 1:
+            return frame
+        if self._preview_buf is None or self._preview_buf.shape[:2] != (th, tw):
+            self._preview_buf = np.empty((th, tw, 3), dtype=np.uint8)
+        return cv2.resize(frame, (tw, th), dst=self._preview_buf,
+                          interpolation=cv2.INTER_AREA)
+
     # ------------------------------------------------------------------
     # Main loop
     # ------------------------------------------------------------------
@@ -154,19 +234,30 @@ class WorkerThread(QThread):
             if not camera.open():
                 self.error.emit('Could not open camera.')
                 return
+            if config.get('camera.async_capture'):
+                camera.start_async()   # capture overlaps inference
 
+            configure_opencv(config.get('hand_tracking.opencv_threads'))
             hand_tracker = HandTracker(
                 max_num_hands            = config.get('hand_tracking.max_num_hands'),
                 min_detection_confidence = config.get('hand_tracking.min_detection_confidence'),
                 min_tracking_confidence  = config.get('hand_tracking.min_tracking_confidence'),
+                live_stream              = config.get('hand_tracking.live_stream'),
+                detect_size              = config.get('hand_tracking.detect_size'),
+                use_opencl               = config.get('hand_tracking.use_opencl'),
+                use_gpu                  = config.get('hand_tracking.use_gpu'),
+                model_path               = config.get('hand_tracking.model_path'),
+                detect_every             = config.get('hand_tracking.detect_every'),
+                frame_budget             = 1.0 / max(camera.fps, 1),
             )
 
-            gesture_classifier = GestureClassifier()
-
             activation_manager = ActivationManager(
                 open_palm_duration   = config.get('activation.open_palm_duration'),
                 cooldown_duration    = config.get('activation.cooldown_duration'),
                 stability_threshold  = config.get('activation.stability_threshold'),
+                stability_ratio      = config.get('activation.stability_ratio'),
+                leading_frames       = config.get('activation.leading_frames'),
+                adaptive_cooldown    = config.get('activation.adaptive_cooldown'),
             )
 
             decision_engine = DecisionEngine()
@@ -180,71 +271,87 @@ class WorkerThread(QThread):
             _prev_mode  = decision_engine.current_mode
             fps_counter = FPSCounter()
 
-            state.emit_log(_ts(), 'SYSTEM', 'Pipeline started — show Open Palm to activate')
+            # Drain one queued frame whenever inference overruns a frame period
+            frame_period = 1.0 / max(camera.fps, 1)
+            skip         = 0
+
+            state.emit_log(self._ts(), 'SYSTEM', 'Pipeline started — show Open Palm to activate')
+
+            # Display settings are fixed for the session — read them once
+            landmark_outlines = config.get('display.landmark_outlines')
+
+            # Mirrored frames are written into one reused buffer; it is safe to
+            # overwrite because _frame_to_qimage() detaches a copy each frame
+            mirror: np.ndarray | None = None
+
+            # Loop-invariant lookups bound to locals once
+            perf_counter  = time.perf_counter
+            action_labels = action_executor._LABELS
 
             # ----------------------------------------------------------------
             # Frame loop
             # ----------------------------------------------------------------
             while self._running:
-                t_start = time.perf_counter()
+                t_start = perf_counter()
 
-                ok, frame = camera.read_frame()
+                ok, frame = camera.read_frame(skip=skip)
                 if not ok or frame is None:
                     continue
 
                 # Mirror for natural interaction
-                frame = cv2.flip(frame, 1)
+                if mirror is None or mirror.shape != frame.shape:
+                    mirror = np.empty_like(frame)
+                frame = cv2.flip(frame, 1, dst=mirror)
 
                 # ----------------------------------------------------------
                 # Hand detection + gesture classification
                 # ----------------------------------------------------------
-                detection_result = hand_tracker.detect_hands(frame)
-                hands_info       = hand_tracker.get_hands_info(detection_result)
+                t_detect         = perf_counter()
+                detection_result = hand_tracker.detect_hands(frame, camera.last_frame_time)
+                skip             = int(perf_counter() - t_detect > frame_period)
 
                 gesture: str | None = None
                 confidence          = 0.0
 
-                # Prefer right hand; fall back to left
-                hand_data = hands_info.get('right') or hands_info.get('left')
+                # Prefer right hand; fall back to left (only that hand is classified)
+                hand_data = hand_tracker.get_primary_hand(detection_result)
                 if hand_data:
-                    finger_states = hand_data['finger_states']
-                    gesture       = gesture_classifier.classify(finger_states)
+                    gesture       = hand_data['gesture']
                     confidence    = 1.0   # classifier is rule-based, always 1.0 on match
                     if gesture == 'Unknown':
                         gesture    = None
                         confidence = 0.0
 
                     # Draw hand skeleton
-                    hand_tracker.draw_landmarks(frame, detection_result)
+                    hand_tracker.draw_landmarks(
+                        frame, detection_result,
+                        outline=landmark_outlines,
+                    )
 
                 # ----------------------------------------------------------
                 # Smart Mode decision
                 # ----------------------------------------------------------
                 action, mode_changed = decision_engine.process(gesture)
 
+                mode = decision_engine.current_mode
                 if mode_changed:
-                    new_mode = decision_engine.current_mode
-                    state.set_mode(new_mode)
-                    state.emit_log(_ts(), 'MODE', f'Switched to {new_mode}')
+                    state.set_mode(mode)
+                    state.emit_log(self._ts(), 'MODE', f'Switched to {mode}')
                     # Reset air mouse when leaving System Mode
-                    if _prev_mode == 'System Mode' and new_mode != 'System Mode':
+                    if _prev_mode == 'System Mode' and mode != 'System Mode':
                         air_mouse.reset()
-                    _prev_mode = new_mode
-
-                # Mode-switch stability bar
-                state.set_mode_stability(decision_engine.mode_stability_progress)
+                    _prev_mode = mode
 
                 # ----------------------------------------------------------
                 # Activation manager
                 # ----------------------------------------------------------
                 should_execute = activation_manager.update(gesture)
-                state.set_system_active(activation_manager.is_active)
-                state.set_cooldown(activation_manager.is_in_cooldown)
+                am_active      = activation_manager.is_active   # snapshot for this frame
 
                 # ----------------------------------------------------------
                 # Execute action  (System Mode → air mouse; others → executor)
                 # ----------------------------------------------------------
-                if decision_engine.current_mode == 'System Mode' and activation_manager.is_active:
+                if mode == 'System Mode' and am_active:
                     if hand_data:
                         am_label = air_mouse.update(
                             landmarks     = hand_data['landmarks'],
@@ -254,31 +361,34 @@ class WorkerThread(QThread):
                             frame_h       = frame.shape[0],
                         )
                         if am_label:
-                            state.emit_log(_ts(), 'ACTION', f'{am_label}  [System Mode]')
+                            state.emit_log(self._ts(), 'ACTION', f'{am_label}  [System Mode]')
                 elif should_execute and action:
                     action_executor.execute(action)
-                    label = action_executor._LABELS.get(action, action)
-                    state.emit_log(_ts(), 'ACTION', f'{label}  [{decision_engine.current_mode}]')
+                    label = action_labels.get(action, action)
+                    state.emit_log(self._ts(), 'ACTION', f'{label}  [{mode}]')
                     state.set_action_executed(action)
                     # ---- performance log ----
                     _perf = get_performance_logger()
                     _perf.info(
                         f'gesture={gesture!r}  '
-                        f'recognition_ms={(time.perf_counter() - t_start) * 1000:.1f}  '
+                        f'recognition_ms={(perf_counter() - t_start) * 1000:.1f}  '
                         f'action={action!r}  '
-                        f'mode={decision_engine.current_mode!r}'
+                        f'mode={mode!r}'
                     )
 
                 # ----------------------------------------------------------
-                # Update telemetry
+                # Collect telemetry (applied to SharedState on the GUI thread)
                 # ----------------------------------------------------------
                 fps_counter.update()
-                latency_ms = (time.perf_counter() - t_start) * 1000
-
-                state.set_gesture(gesture or '')
-                state.set_confidence(confidence)
-                state.set_fps(fps_counter.fps)
-                state.set_latency(latency_ms)
+                telemetry = FrameTelemetry(
+                    gesture        = gesture or '',
+                    confidence     = confidence,
+                    fps            = fps_counter.fps,
+                    latency_ms     = (perf_counter() - t_start) * 1000,
+                    mode_stability = decision_engine.mode_stability_progress,
+                    system_active  = am_active,
+                    in_cooldown    = activation_manager.is_in_cooldown,
+                )
 
                 # ----------------------------------------------------------
                 # Annotate and emit frame
@@ -286,18 +396,18 @@ class WorkerThread(QThread):
                 _draw_overlay(
                     frame,
                     gesture,
-                    decision_engine.current_mode,
-                    activation_manager.is_active,
+                    mode,
+                    am_active,
                     fps_counter.fps,
                 )
 
-                self.frame_ready.emit(_frame_to_qimage(frame))
+                self.frame_ready.emit(_frame_to_qimage(self._preview_frame(frame)), telemetry)
+                activation_manager.flush_events()
 
             # ---- Loop exited cleanly ---
             camera.release()
             hand_tracker.close()
-            state.set_system_active(False)
-            state.emit_log(_ts(), 'SYSTEM', 'Pipeline stopped')
+            state.emit_log(self._ts(), 'SYSTEM', 'Pipeline stopped')
 
         except Exception as exc:
             import traceback
@@ -22,19 +22,31 @@ class Config:
             'width': 1280,
             'height': 720,
             'fps': 30,
+            'async_capture': True,
         },
         'hand_tracking': {
             'max_num_hands': 2,
             'min_detection_confidence': 0.7,
             'min_tracking_confidence': 0.5,
+            'live_stream': False,
+            'detect_size': 256,
+            'use_opencl': False,
+            'use_gpu': True,
+            'model_path': None,      # None → bundled hand_landmarker.task
+            'detect_every': 1,       # infer every Nth frame; 0 = adapt to load
+            'opencv_threads': None,  # None → half the logical CPUs
         },
         'activation': {
             'open_palm_duration': 2.0,
             'cooldown_duration': 1.0,
             'stability_threshold': 10,
+            'stability_ratio': 0.8,
+            'leading_frames': 3,
+            'adaptive_cooldown': False,
         },
         'display': {
             'show_landmarks': True,
+            'landmark_outlines': True,
             'show_gesture': True,
             'show_status': True,
             'show_fps': True,
@@ -12,8 +12,11 @@ the FPS value onto the video frame.
 """
 
 import time
+
 import cv2
 
+from utils.overlay import text_sprite
+
 
 class FPSCounter:
     """Rolling-average FPS counter."""
@@ -48,14 +51,7 @@ class FPSCounter:
 
     def display_fps(self, frame):
         """Render FPS counter onto the top-left corner of a frame."""
-        cv2.putText(
-            frame,
-            f'FPS: {int(self._fps)}',
-            (10, 30),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.7,
-            (0, 255, 0),
-            2,
-            cv2.LINE_AA,
-        )
+        sprite, dx, dy = text_sprite(f'FPS: {int(self._fps)}', 0.7, (0, 255, 0),
+                                     2, cv2.LINE_AA)
+        sprite.blit(frame, 10 + dx, 30 + dy)
         return frame
@@ -1,11 +1,15 @@
 """
 Module: logger.py
 Description: Performance logging utility — creates a file-based logger that
-             records gesture recognition events to logs/mmgi_performance.log.
+             records gesture recognition events to logs/mmgi_performance.log,
+             plus a queue-backed console logger for the frame loop.
 Author: Pratham Chaturvedi
 """
 
 import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 _perf_logger: logging.Logger | None = None
@@ -34,3 +38,25 @@ def get_performance_logger() -> logging.Logger:
         _perf_logger.addHandler(fh)
 
     return _perf_logger
+
+
+def start_console_logger(name: str = 'mmgi.console') -> tuple[logging.Logger, QueueListener]:
+    """
+    Return a logger whose records are printed to stdout by a background thread.
+
+    Logging calls only enqueue the record, so a slow terminal never stalls
+    the caller.  Call .stop() on the returned listener to flush and finish.
+    """
+    log_q: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter('%(message)s'))
+    listener = QueueListener(log_q, stream)
+
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.handlers[:] = [QueueHandler(log_q)]
+
+    listener.start()
+    return logger, listener
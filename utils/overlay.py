@@ -0,0 +1,126 @@
+"""
+Module: overlay.py
+Description: Sprite helpers for HUD overlays — pre-rendered BGR patches with
+             a per-pixel alpha mask that are composited into a small frame
+             ROI instead of re-rasterising text and shapes every frame.
+Author: Pratham Chaturvedi
+
+utils/overlay.py - HUD Sprite Compositor
+
+Most overlay content (gesture labels, status panels, banners) only takes a
+handful of distinct values, so each one is drawn once onto a small canvas
+and then blitted into the frame on every subsequent frame.
+"""
+
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+
+@lru_cache(maxsize=32)
+def _tint_lut(colour: tuple[int, int, int], alpha: float) -> np.ndarray:
+    """256×1×3 lookup table computing  v·(1−alpha) + colour·alpha  per channel."""
+    v = np.arange(256, dtype=np.float32)[:, None]
+    lut = v * (1.0 - alpha) + np.asarray(colour, dtype=np.float32)[None, :] * alpha
+    return np.round(lut).astype(np.uint8).reshape(256, 1, 3)
+
+
+def tint_rect(frame: np.ndarray, pt1: tuple[int, int], pt2: tuple[int, int],
+              colour: tuple[int, int, int], alpha: float) -> None:
+    """
+    Blend a solid rectangle into frame in-place (opacity = alpha).
+
+    Equivalent to drawing the filled rectangle on a full-frame copy and
+    addWeighted-ing it back, but only the rectangle's own pixels are touched.
+    """
+    h, w = frame.shape[:2]
+    x0, y0 = max(min(pt1[0], pt2[0]), 0), max(min(pt1[1], pt2[1]), 0)
+    x1, y1 = min(max(pt1[0], pt2[0]) + 1, w), min(max(pt1[1], pt2[1]) + 1, h)
+    if x0 >= x1 or y0 >= y1:
+        return
+    roi = frame[y0:y1, x0:x1]
+    cv2.LUT(roi, _tint_lut(tuple(colour), float(alpha)), dst=roi)
+
+
+@lru_cache(maxsize=256)
+def text_sprite(text: str, scale: float, colour: tuple[int, int, int],
+                thickness: int = 1, line_type: int = cv2.LINE_8) -> tuple['Sprite', int, int]:
+    """
+    Return (sprite, dx, dy) for a line of FONT_HERSHEY_SIMPLEX text, rendered
+    once per distinct argument set.  dx/dy offset the sprite's top-left from
+    the text baseline origin, i.e. blit at (x + dx, y + dy) to match
+    cv2.putText(frame, text, (x, y), ...).
+    """
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    (tw, th), baseline = cv2.getTextSize(text, font, scale, thickness)
+    pad    = thickness + 1
+    ox, oy = pad, th + pad                           # text origin in sprite
+    sprite = Sprite(tw + 2 * pad, th + baseline + 2 * pad)
+    mask   = np.zeros((sprite.height, sprite.width), dtype=np.uint8)
+    cv2.putText(sprite.image, text, (ox, oy), font, scale, colour, thickness, line_type)
+    cv2.putText(mask, text, (ox, oy), font, scale, 255, thickness, line_type)
+    sprite.set_alpha_from_mask(mask)
+    return sprite, -ox, -oy
+
+
+class Sprite:
+    """A small pre-rendered BGR image plus a float alpha mask (0–1)."""
+
+    __slots__ = ('image', 'alpha')
+
+    def __init__(self, width: int, height: int):
+        self.image = np.zeros((height, width, 3), dtype=np.uint8)
+        self.alpha = np.zeros((height, width, 1), dtype=np.float32)
+
+    @property
+    def width(self) -> int:
+        return self.image.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.image.shape[0]
+
+    def set_alpha_from_mask(self, mask: np.ndarray, opacity: float = 1.0) -> None:
+        """
+        Set alpha from a uint8 single-channel coverage mask (0–255).
+
+        The image is assumed to have been drawn on a black canvas with the
+        same strokes as the mask, so partially covered (anti-aliased) pixels
+        are un-premultiplied back to their full colour.
+        """
+        partial = (mask > 0) & (mask < 255)
+        if partial.any():
+            scale = 255.0 / mask[partial].astype(np.float32)
+            self.image[partial] = np.clip(
+                self.image[partial] * scale[:, None] + 0.5, 0, 255,
+            ).astype(np.uint8)
+        np.multiply(mask[..., None], opacity / 255.0, out=self.alpha, casting='unsafe')
+
+    def set_layers(self, mask: np.ndarray, background: tuple[int, int, int],
+                   opacity: float) -> None:
+        """
+        Flatten anti-aliased foreground strokes over a translucent solid fill.
+
+        self.image must hold the foreground drawn on a black canvas and mask
+        its coverage (uint8); the fill is background at the given opacity.
+        """
+        c = mask[..., None].astype(np.float32) * (1.0 / 255.0)
+        a = opacity + (1.0 - opacity) * c
+        img = (np.asarray(background, dtype=np.float32) * (opacity * (1.0 - c))
+               + self.image) / np.maximum(a, 1e-6)
+        np.copyto(self.image, np.clip(img + 0.5, 0, 255), casting='unsafe')
+        self.alpha[:] = a
+
+    def blit(self, frame: np.ndarray, x: int, y: int) -> None:
+        """Composite the sprite onto frame with its top-left at (x, y), clipped."""
+        fh, fw = frame.shape[:2]
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + self.width, fw), min(y + self.height, fh)
+        if x0 >= x1 or y0 >= y1:
+            return
+        sx, sy = x0 - x, y0 - y
+        img = self.image[sy:sy + (y1 - y0), sx:sx + (x1 - x0)]
+        a   = self.alpha[sy:sy + (y1 - y0), sx:sx + (x1 - x0)]
+        roi = frame[y0:y1, x0:x1]
+        np.copyto(roi, roi + (img - roi.astype(np.float32)) * a + 0.5, casting='unsafe')